@@ -1,193 +1,325 @@
-"""
-Kargo Paketleme Video Kayit ve Etiket Bilgi Cikarma Sistemi
-- CAM adli kameradan video alir
-- Paketleme islemini kaydeder
-- Paket etiketinden isim, soyisim, adres bilgilerini OCR ile okur
-- Video ve text bilgi dosyasini DATASERVICE klasorune kaydeder
-
-Gereksinimler:
-- Python 3.x
-- OpenCV (cv2)
-- pytesseract
-- Tesseract OCR sistem PATH'de olmali
-
-Kullanim:
-- Script calistirilir
-- CAM adiyle kamera acilir
-- Kayda baslamak icin 'r' tusuna basilir
-- Kaydi durdurup video + etiket bilgisi kaydetmek icin 'q' tusu kullanilir
-- Cikmak icin ESC veya Ctrl+C
-
-Not:
-- CAMERA_ADI degiskenini kendi kamera ayarina gore ayarlayin
-"""
-
-import cv2
-import pytesseract
-import os
-from datetime import datetime
-
-# Ayarlar
-KAMERA_ADI = "CAM"  # Kamera cihaz adi veya eslesen index stringi
-VERIYERI_KLASOR = "DATASERVICE"
-VIDEO_FPS = 20.0
-VIDEO_KODEK = "XVID"
-VIDEO_KAYIT_SURESI = 30  # saniye olarak susur (istediginiz gibi ayarlayabilirsiniz)
-
-def kamera_index_bul(kamera_adi):
-    """
-    Kamera cihaz adi ile eslesen kameranin indexini bulmaya calisir
-    OpenCV cihaz adini direkt saglamadigi icin bu yontem.
-    Gerektiginde her isletim sistemine gore ozellestirilebilir.
-    """
-    print("Kamera aranıyor:", kamera_adi)
-    for i in range(10):
-        cap = cv2.VideoCapture(i)
-        if cap.isOpened():
-            ret, frame = cap.read()
-            if ret:
-                print(f"Kamera index {i} aktif")
-                cap.release()
-                return i
-            cap.release()
-    print("Kamera bulunamadi, varsayilan 0 kullaniliyor")
-    return 0
-
-def klasor_varsa_olustur(yol):
-    if not os.path.exists(yol):
-        os.makedirs(yol)
-
-def bilgi_txt_kaydet(klasor_yolu, isim, soyisim, adres, tarih_str):
-    dosya_adi = os.path.join(klasor_yolu, f"{isim}_{soyisim}_{tarih_str}.txt")
-    with open(dosya_adi, 'w', encoding='utf-8') as f:
-        f.write(f"Isim: {isim}\n")
-        f.write(f"Soyisim: {soyisim}\n")
-        f.write(f"Adres: {adres}\n")
-        f.write(f"Tarih: {tarih_str}\n")
-    print(f"Bilgi kaydedildi: {dosya_adi}")
-
-def etiket_metni_coz(ocr_metin):
-    """
-    OCR'den gelen metni isleyip isim, soyisim, adres bilgilerini cekmeye calisir
-    Basit kural tabanli ayristirma. Gercek etiket formati degisebilir, uyarlayin.
-    """
-    satirlar = [satir.strip() for satir in ocr_metin.split('\n') if satir.strip()]
-    isim = soyisim = adres = "BILINMIYOR"
-    for satir in satirlar:
-        kucuk = satir.lower()
-        if "isim" in kucuk and isim == "BILINMIYOR":
-            isim = satir.split(":")[-1].strip()
-        elif "soyisim" in kucuk and soyisim == "BILINMIYOR":
-            soyisim = satir.split(":")[-1].strip()
-        elif "adres" in kucuk and adres == "BILINMIYOR":
-            adres = satir.split(":")[-1].strip()
-    return isim, soyisim, adres
-
-def main():
-    klasor_varsa_olustur(VERIYERI_KLASOR)
-
-    kamera_indeks = kamera_index_bul(KAMERA_ADI)
-    cap = cv2.VideoCapture(kamera_indeks)
-    if not cap.isOpened():
-        print("Kamera acilamadi. Cikis yapiliyor.")
-        return
-
-    print("Kayida baslamak icin 'r' tusuna basiniz.")
-    print("Kaydi durdurup kaydetmek icin 'q' tusuna basiniz.")
-    print("Cikmak icin ESC'e basin veya Ctrl+C yapin.")
-
-    kayit_yapiliyor = False
-    video_cikisi = None
-    baslangic_zamani = None
-    kaydedilen_kare_sayisi = 0
-    max_kare_sayisi = int(VIDEO_FPS * VIDEO_KAYIT_SURESI)
-    son_kare = None
-
-    while True:
-        ret, kare = cap.read()
-        if not ret:
-            print("Kare alinamadi.")
-            break
-
-        # Canli goruntu gosterimi
-        cv2.imshow("Paketleme Kamerasi - Kayit icin r basin", kare)
-
-        tus = cv2.waitKey(1) & 0xFF
-
-        if tus == 27:  # ESC tusu
-            print("Cikis yapiliyor...")
-            break
-
-        if not kayit_yapiliyor and tus == ord('r'):
-            # Kayit baslat
-            tarih_saat = datetime.now().strftime("%Y%m%d_%H%M%S")
-            video_dosya = os.path.join(VERIYERI_KLASOR, f"paketleme_{tarih_saat}.avi")
-            fourcc = cv2.VideoWriter_fourcc(*VIDEO_KODEK)
-            yukseklik, genislik = kare.shape[:2]
-            video_cikisi = cv2.VideoWriter(video_dosya, fourcc, VIDEO_FPS, (genislik, yukseklik))
-            kayit_yapiliyor = True
-            baslangic_zamani = datetime.now()
-            kaydedilen_kare_sayisi = 0
-            print(f"Kayit basladi: {video_dosya}")
-
-        if kayit_yapiliyor:
-            video_cikisi.write(kare)
-            kaydedilen_kare_sayisi += 1
-            son_kare = kare.copy()
-
-            if kaydedilen_kare_sayisi >= max_kare_sayisi:
-                print("Maks sure doldu, kayit durduruluyor...")
-                kayit_yapiliyor = False
-                video_cikisi.release()
-                video_cikisi = None
-
-                if son_kare is not None:
-                    print("Etiket bilgisi cikartiliyor...")
-                    gri = cv2.cvtColor(son_kare, cv2.COLOR_BGR2GRAY)
-                    _, esik = cv2.threshold(gri, 150, 255, cv2.THRESH_BINARY)
-                    ocr_metin = pytesseract.image_to_string(esik, lang='tur')  # dil 'tur' olabilir
-
-                    print("OCR Metin:")
-                    print(ocr_metin)
-
-                    isim, soyisim, adres = etiket_metni_coz(ocr_metin)
-
-                    tarih_str = baslangic_zamani.strftime("%Y%m%d_%H%M%S")
-                    yeni_video_adi = os.path.join(VERIYERI_KLASOR, f"{isim}_{soyisim}_{tarih_str}.avi")
-                    os.rename(video_dosya, yeni_video_adi)
-                    print(f"Video kaydedildi: {yeni_video_adi}")
-
-                    bilgi_txt_kaydet(VERIYERI_KLASOR, isim, soyisim, adres, tarih_str)
-
-        if kayit_yapiliyor and tus == ord('q'):
-            print("Kayit elle durduruldu.")
-            kayit_yapiliyor = False
-            video_cikisi.release()
-            video_cikisi = None
-
-            if son_kare is not None:
-                print("Etiket bilgisi cikartiliyor...")
-                gri = cv2.cvtColor(son_kare, cv2.COLOR_BGR2GRAY)
-                _, esik = cv2.threshold(gri, 150, 255, cv2.THRESH_BINARY)
-                ocr_metin = pytesseract.image_to_string(esik, lang='tur')
-
-                print("OCR Metin:")
-                print(ocr_metin)
-
-                isim, soyisim, adres = etiket_metni_coz(ocr_metin)
-
-                tarih_str = baslangic_zamani.strftime("%Y%m%d_%H%M%S")
-                yeni_video_adi = os.path.join(VERIYERI_KLASOR, f"{isim}_{soyisim}_{tarih_str}.avi")
-                os.rename(video_dosya, yeni_video_adi)
-                print(f"Video kaydedildi: {yeni_video_adi}")
-
-                bilgi_txt_kaydet(VERIYERI_KLASOR, isim, soyisim, adres, tarih_str)
-
-    cap.release()
-    if video_cikisi is not None:
-        video_cikisi.release()
-    cv2.destroyAllWindows()
-
-if __name__ == "__main__":
-    main()
-
+"""
+Kargo Paketleme Video Kayit ve Etiket Bilgi Cikarma Sistemi
+- CAM adli kameradan video alir
+- Paketleme islemini kaydeder
+- Paket etiketinden isim, soyisim, adres bilgilerini OCR ile okur
+- Video ve text bilgi dosyasini DATASERVICE klasorune kaydeder
+
+Gereksinimler:
+- Python 3.x
+- OpenCV (cv2)
+- pytesseract (tesserocr kuruluysa Tesseract surec acilmadan kullanilir)
+- cargo_ocr.py, label_roi.py ve ocr_engine.py (ayni klasorde)
+- Tesseract OCR sistem PATH'de olmali
+
+Kullanim:
+- Script calistirilir
+- CAM adiyle kamera acilir
+- Kayda baslamak icin 'r' tusuna basilir
+- Kaydi durdurup video + etiket bilgisi kaydetmek icin 'q' tusu kullanilir
+- Cikmak icin ESC veya Ctrl+C
+
+Not:
+- CAMERA_ADI degiskenini kendi kamera ayarina gore ayarlayin
+- Kamera okuma, video yazma ve OCR ayri thread'lerde calisir; OCR surerken
+  onizleme donmaz ve video VIDEO_FPS hizinda yazilmaya devam eder
+- OCR son kareye degil, kayit boyunca en net ve etiketi en iyi gorunen
+  ETIKET_ADAY_SAYISI kareye paralel uygulanir; alanlar cogunluk oyuyla birlestirilir
+"""
+
+import cv2
+import logging
+import os
+import queue
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from cargo_ocr import EtiketKareSecici, TextDosyasiDeposu, etiket_oku, get_backend
+
+# Ayarlar
+KAMERA_ADI = "CAM"  # Kamera cihaz adi veya eslesen index stringi
+VERIYERI_KLASOR = "DATASERVICE"
+VIDEO_FPS = 20.0
+VIDEO_KODEK = "XVID"
+VIDEO_KAYIT_SURESI = 30  # saniye olarak susur (istediginiz gibi ayarlayabilirsiniz)
+KARE_TAMPON_KAPASITESI = 64  # kodlayici gecikirse bekleyebilecek kare sayisi; dolunca en eski kare atilir
+OCR_KUYRUK_KAPASITESI = 4  # OCR bekleyen kayit sayisi
+ETIKET_ADAY_SAYISI = 3  # kayit basina OCR uygulanacak en iyi kare sayisi
+ETIKET_PUANLAMA_ARALIGI = 1  # her kac yazilan karede bir netlik/etiket puani hesaplanir (320 pikselde ~1 ms)
+
+def kamera_index_bul(kamera_adi):
+    """
+    Kamera cihaz adi ile eslesen kameranin indexini bulmaya calisir
+    OpenCV cihaz adini direkt saglamadigi icin bu yontem.
+    Gerektiginde her isletim sistemine gore ozellestirilebilir.
+    """
+    print("Kamera aranıyor:", kamera_adi)
+    for i in range(10):
+        cap = cv2.VideoCapture(i)
+        if cap.isOpened():
+            ret, frame = cap.read()
+            if ret:
+                print(f"Kamera index {i} aktif")
+                cap.release()
+                return i
+            cap.release()
+    print("Kamera bulunamadi, varsayilan 0 kullaniliyor")
+    return 0
+
+def klasor_varsa_olustur(yol):
+    if not os.path.exists(yol):
+        os.makedirs(yol)
+
+class HalkaTampon:
+    """
+    Sabit kapasiteli, thread-guvenli halka tampon.
+    Doluyken yeni oge gelirse en eski oge atilir ve `dusen` sayaci artar.
+    """
+    def __init__(self, kapasite):
+        self._ogeler = deque(maxlen=kapasite)
+        self._kosul = threading.Condition()
+        self.dusen = 0
+
+    def koy(self, oge):
+        with self._kosul:
+            if len(self._ogeler) == self._ogeler.maxlen:
+                self.dusen += 1
+            self._ogeler.append(oge)
+            self._kosul.notify()
+
+    def bosalt(self):
+        with self._kosul:
+            ogeler = list(self._ogeler)
+            self._ogeler.clear()
+        return ogeler
+
+    def bekle(self, zaman_asimi):
+        # Tampona oge gelene ya da sure dolana kadar bekler
+        with self._kosul:
+            return self._kosul.wait_for(lambda: self._ogeler, zaman_asimi)
+
+class KameraOkuyucu(threading.Thread):
+    """
+    Kameradan surekli kare okur. En son kare onizleme icin saklanir;
+    kayit suruyorsa kare ayrica `hedef` tampona konur.
+    """
+    def __init__(self, cap):
+        super().__init__(name="kamera", daemon=True)
+        self.cap = cap
+        self.hedef = None
+        self._son_kare = None
+        self._kare_no = 0
+        self._kosul = threading.Condition()
+        self._dur = threading.Event()
+
+    def run(self):
+        while not self._dur.is_set():
+            ret, kare = self.cap.read()
+            if not ret:
+                break
+            hedef = self.hedef
+            if hedef is not None:
+                hedef.koy(kare)
+            with self._kosul:
+                self._son_kare = kare
+                self._kare_no += 1
+                self._kosul.notify_all()
+        with self._kosul:
+            self._kosul.notify_all()
+
+    def yeni_kare(self, onceki_no, zaman_asimi=1.0):
+        """onceki_no'dan sonra gelen ilk kareyi (no, kare) olarak dondurur; gelmezse kare None olur."""
+        with self._kosul:
+            self._kosul.wait_for(lambda: self._kare_no != onceki_no or not self.is_alive(), zaman_asimi)
+            if self._kare_no == onceki_no:
+                return onceki_no, None
+            return self._kare_no, self._son_kare
+
+    def durdur(self):
+        self._dur.set()
+        self.join()
+
+class VideoKaydedici(threading.Thread):
+    """
+    Tampondaki kareleri sabit VIDEO_FPS hizinda videoya yazar.
+    Kamera daha hizliysa aradaki kareler atlanir, gecikirse son kare tekrarlanir;
+    boylece video suresi gercek sureyle ayni kalir. Kayit bitince `bitince` cagrilir.
+    """
+    def __init__(self, video_dosya, boyut, max_kare_sayisi, bitince):
+        super().__init__(name="kodlayici", daemon=True)
+        self.video_dosya = video_dosya
+        self.tampon = HalkaTampon(KARE_TAMPON_KAPASITESI)
+        self.max_kare_sayisi = max_kare_sayisi
+        self.bitince = bitince
+        self.baslangic_zamani = datetime.now()
+        self.yazilan = 0
+        self.atlanan = 0
+        self.tekrarlanan = 0
+        self.son_kare = None
+        self.secici = EtiketKareSecici(ETIKET_ADAY_SAYISI, ETIKET_PUANLAMA_ARALIGI)
+        self._dur = threading.Event()
+        fourcc = cv2.VideoWriter_fourcc(*VIDEO_KODEK)
+        self._video_cikisi = cv2.VideoWriter(video_dosya, fourcc, VIDEO_FPS, boyut)
+
+    def run(self):
+        aralik = 1.0 / VIDEO_FPS
+        baslangic = time.perf_counter()
+        try:
+            while not self._dur.is_set() and self.yazilan < self.max_kare_sayisi:
+                kareler = self.tampon.bosalt()
+                if kareler:
+                    self.atlanan += len(kareler) - 1
+                    self.son_kare = kareler[-1]
+                    self.secici.degerlendir(self.son_kare)
+                if self.son_kare is None:
+                    # Ilk kare gelene kadar donmeden beklenir
+                    self.tampon.bekle(aralik)
+                    continue
+                # Gecen sureye gore yazilmasi gereken kare sayisina kadar yazilir
+                hedef = min(self.max_kare_sayisi, int((time.perf_counter() - baslangic) / aralik) + 1)
+                yeni = bool(kareler)
+                while self.son_kare is not None and self.yazilan < hedef:
+                    self._video_cikisi.write(self.son_kare)
+                    self.yazilan += 1
+                    if not yeni:
+                        self.tekrarlanan += 1
+                    yeni = False
+                self._dur.wait(max(0.0, baslangic + self.yazilan * aralik - time.perf_counter()))
+        finally:
+            self._video_cikisi.release()
+        print(f"Kayit bitti: {self.yazilan} kare yazildi, {self.atlanan} atlandi, "
+              f"{self.tekrarlanan} tekrarlandi, tampondan {self.tampon.dusen} kare dustu")
+        self.bitince(self)
+
+    def durdur(self):
+        self._dur.set()
+        self.join()
+
+class EtiketIsleyici(threading.Thread):
+    """Biten kayitlarin etiket OCR'ini, video adlandirmasini ve bilgi dosyasini arka planda yapar."""
+    def __init__(self):
+        super().__init__(name="ocr", daemon=True)
+        self.isler = queue.Queue(maxsize=OCR_KUYRUK_KAPASITESI)
+        # Dil verisi bir kez yuklenir; aday kareler motor havuzunda paralel okunur
+        self.motor = get_backend("tesseract", "tur", ETIKET_ADAY_SAYISI)
+        self.depo = TextDosyasiDeposu(VERIYERI_KLASOR)
+        self.dusen = 0
+
+    def ekle(self, kaydedici):
+        # Puanlama araligina denk gelmeyen kisa kayitlarda son kare kullanilir
+        kareler = kaydedici.secici.adaylar()
+        if not kareler and kaydedici.son_kare is not None:
+            kareler = [kaydedici.son_kare]
+        if not kareler:
+            return
+        # Kodlayici thread'inden cagrilir ve 'q' ile GUI thread'i onu bekler; kuyruk doluysa beklenmez
+        try:
+            self.isler.put_nowait((kaydedici.video_dosya, kareler, kaydedici.baslangic_zamani))
+        except queue.Full:
+            self.dusen += 1
+            print(f"OCR kuyrugu dolu, {kaydedici.video_dosya} etiketlenmeden birakildi "
+                  f"(toplam {self.dusen} kayit)")
+
+    def run(self):
+        while True:
+            is_ = self.isler.get()
+            if is_ is None:
+                break
+            try:
+                etiket_isle(*is_, motor=self.motor, depo=self.depo)
+            except Exception as e:
+                print(f"Etiket islenemedi: {e}")
+
+    def durdur(self):
+        # Kuyruktaki kayitlar bitirilmeden cikilmaz
+        self.isler.put(None)
+        self.join()
+
+def etiket_isle(video_dosya, kareler, baslangic_zamani, motor=None, depo=None):
+    print(f"Etiket bilgisi cikartiliyor ({len(kareler)} aday kare)...")
+    bilgi = etiket_oku(kareler, motor)
+
+    print("OCR Metin:")
+    print(bilgi.metin)
+
+    tarih_str = baslangic_zamani.strftime("%Y%m%d_%H%M%S")
+    yeni_video_adi = os.path.join(VERIYERI_KLASOR, f"{bilgi.isim}_{bilgi.soyisim}_{tarih_str}.avi")
+    os.rename(video_dosya, yeni_video_adi)
+    print(f"Video kaydedildi: {yeni_video_adi}")
+
+    # Kayit yolu depo tarafindan loglanir
+    (depo or TextDosyasiDeposu(VERIYERI_KLASOR)).kaydet(bilgi, tarih_str)
+
+def main():
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    klasor_varsa_olustur(VERIYERI_KLASOR)
+
+    kamera_indeks = kamera_index_bul(KAMERA_ADI)
+    cap = cv2.VideoCapture(kamera_indeks)
+    if not cap.isOpened():
+        print("Kamera acilamadi. Cikis yapiliyor.")
+        return
+
+    print("Kayida baslamak icin 'r' tusuna basiniz.")
+    print("Kaydi durdurup kaydetmek icin 'q' tusuna basiniz.")
+    print("Cikmak icin ESC'e basin veya Ctrl+C yapin.")
+
+    max_kare_sayisi = int(VIDEO_FPS * VIDEO_KAYIT_SURESI)
+    okuyucu = KameraOkuyucu(cap)
+    isleyici = EtiketIsleyici()
+    okuyucu.start()
+    isleyici.start()
+    kaydedici = None
+    kare_no = 0
+    son_kare = None
+
+    try:
+        while True:
+            kare_no, kare = okuyucu.yeni_kare(kare_no, zaman_asimi=0.05)
+            if kare is None and not okuyucu.is_alive():
+                print("Kare alinamadi.")
+                break
+            if kare is not None:
+                son_kare = kare
+                # Canli goruntu gosterimi; GUI islemleri ana thread'de kalmali
+                cv2.imshow("Paketleme Kamerasi - Kayit icin r basin", kare)
+
+            # Kamera takilsa da pencere olaylari islenir; 'q' ve ESC kacmaz
+            tus = cv2.waitKey(1) & 0xFF
+
+            if tus == 27:  # ESC tusu
+                print("Cikis yapiliyor...")
+                break
+
+            if kaydedici is not None and not kaydedici.is_alive():
+                print("Maks sure doldu, kayit durduruldu.")
+                okuyucu.hedef = None
+                kaydedici = None
+
+            if kaydedici is None and tus == ord('r') and son_kare is not None:
+                # Kayit baslat
+                tarih_saat = datetime.now().strftime("%Y%m%d_%H%M%S")
+                video_dosya = os.path.join(VERIYERI_KLASOR, f"paketleme_{tarih_saat}.avi")
+                yukseklik, genislik = son_kare.shape[:2]
+                kaydedici = VideoKaydedici(video_dosya, (genislik, yukseklik), max_kare_sayisi, isleyici.ekle)
+                kaydedici.start()
+                okuyucu.hedef = kaydedici.tampon
+                print(f"Kayit basladi: {video_dosya}")
+
+            elif kaydedici is not None and tus == ord('q'):
+                print("Kayit elle durduruldu.")
+                okuyucu.hedef = None
+                kaydedici.durdur()
+                kaydedici = None
+    finally:
+        okuyucu.hedef = None
+        if kaydedici is not None:
+            kaydedici.durdur()
+        okuyucu.durdur()
+        isleyici.durdur()
+        cap.release()
+        cv2.destroyAllWindows()
+
+if __name__ == "__main__":
+    main()
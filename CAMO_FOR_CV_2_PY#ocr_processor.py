@@ -1,8 +1,6 @@
-import cv2
-import pytesseract
-
-def process_image(image_path):
-    image = cv2.imread(image_path)
-    gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-    text = pytesseract.image_to_string(gray)
-    return text
+import cv2
+from cargo_ocr import etiket_oku, get_backend
+
+def process_image(image_path):
+    image = cv2.imread(image_path)
+    return etiket_oku([image], get_backend("tesseract", "eng")).metin
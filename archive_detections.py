@@ -0,0 +1,27 @@
+"""Tamamlanmis gunlerin tespitlerini Parquet arsivine tasir.
+
+Kullanim: python archive_detections.py [--retention-days 7]
+Zamanlanmis gorev (cron) olarak gunde bir calistirilmasi yeterlidir.
+"""
+import argparse
+from src.config import HOT_RETENTION_DAYS
+from src.utils.db_manager import SessionLocal
+from src.utils.detection_archive import archive_detections, archive_cutoff
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--retention-days", type=int, default=HOT_RETENTION_DAYS)
+    args = parser.parse_args()
+
+    cutoff = archive_cutoff(retention_days=args.retention_days)
+    db = SessionLocal()
+    try:
+        archived = archive_detections(db, cutoff)
+    finally:
+        db.close()
+    print(f"{cutoff:%Y-%m-%d} öncesi {archived} tespit arşivlendi")
+
+
+if __name__ == "__main__":
+    main()
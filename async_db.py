@@ -0,0 +1,73 @@
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from ..models.detection import Detection
+from .db_manager import detections_page_statement, detections_page
+from .db_engine import is_sqlite, apply_sqlite_pragmas
+from ..config import DB_URL, DB_ECHO, DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_TIMEOUT, SQLITE_BUSY_TIMEOUT_MS
+
+_ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+    "postgres": "postgresql+asyncpg",
+}
+
+
+def async_url(url):
+    scheme, rest = url.split("://", 1)
+    if "+" in scheme:
+        return url
+    if scheme not in _ASYNC_DRIVERS:
+        raise ValueError(f"Async sürücüsü bilinmeyen veritabanı: {scheme}")
+    return f"{_ASYNC_DRIVERS[scheme]}://{rest}"
+
+
+def create_async_db_engine(url=DB_URL):
+    url = async_url(url)
+    options = {"echo": DB_ECHO}
+    if is_sqlite(url):
+        options["connect_args"] = {"timeout": SQLITE_BUSY_TIMEOUT_MS / 1000}
+    else:
+        options.update(
+            pool_size=DB_POOL_SIZE,
+            max_overflow=DB_MAX_OVERFLOW,
+            pool_timeout=DB_POOL_TIMEOUT,
+            pool_pre_ping=True,
+        )
+    engine = create_async_engine(url, **options)
+    if is_sqlite(url):
+        apply_sqlite_pragmas(engine.sync_engine)
+    return engine
+
+
+async_engine = create_async_db_engine()
+AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False)
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as session:
+        yield session
+
+
+async def add_detections_bulk_async(session, detections):
+    if not detections:
+        return 0
+    try:
+        # ORM toplu insert farkli anahtarli satirlari (nesne/metin) kendisi gruplar
+        await session.execute(insert(Detection), detections)
+        await session.commit()
+    except Exception:
+        await session.rollback()
+        raise
+    return len(detections)
+
+
+async def save_detections_async(detections):
+    async with AsyncSessionLocal() as session:
+        return await add_detections_bulk_async(session, detections)
+
+
+async def get_detections_async(session, limit=100, cursor=None, object_name=None,
+                               min_confidence=None, start=None, end=None):
+    statement = detections_page_statement(limit, cursor, object_name, min_confidence, start, end)
+    rows = (await session.execute(statement)).scalars().all()
+    return detections_page(rows, limit)
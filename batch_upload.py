@@ -0,0 +1,50 @@
+import itertools
+import os
+import tarfile
+import zipfile
+from ..config import BATCH_UPLOAD_EXTENSIONS, BATCH_UPLOAD_MAX_MEMBER_BYTES
+
+
+def is_image_name(name):
+    return os.path.splitext(name or "")[1].lower() in BATCH_UPLOAD_EXTENSIONS
+
+
+def read_limited(fileobj, name):
+    """En fazla BATCH_UPLOAD_MAX_MEMBER_BYTES okur; sinir asilirsa bayt yerine ValueError dondurur."""
+    data = fileobj.read(BATCH_UPLOAD_MAX_MEMBER_BYTES + 1)
+    if len(data) > BATCH_UPLOAD_MAX_MEMBER_BYTES:
+        return ValueError(f"{name}: dosya boyutu sınırı aşıldı")
+    return data
+
+
+def iter_archive(fileobj):
+    """Zip/tar arsivindeki goruntuleri sirayla (ad, bayt) olarak verir; arsivin tamami bellege alinmaz.
+
+    Boyut sinirini asan uyeler icin bayt yerine ValueError verilir. Arsiv taninmazsa ValueError firlatir.
+    """
+    fileobj.seek(0)
+    if zipfile.is_zipfile(fileobj):
+        fileobj.seek(0)
+        with zipfile.ZipFile(fileobj) as archive:
+            for info in archive.infolist():
+                if info.is_dir() or not is_image_name(info.filename):
+                    continue
+                # Bildirilen boyuta guvenilmez; okuma sinirla yapilir
+                with archive.open(info) as member:
+                    yield info.filename, read_limited(member, info.filename)
+        return
+    fileobj.seek(0)
+    try:
+        # Akis kipinde uyeler sirayla okunur, dosya icinde geri sarilmaz
+        archive = tarfile.open(fileobj=fileobj, mode="r|*")
+    except tarfile.TarError:
+        raise ValueError("Desteklenmeyen arşiv biçimi; zip veya tar bekleniyor")
+    with archive:
+        for member in archive:
+            if not member.isfile() or not is_image_name(member.name):
+                continue
+            yield member.name, read_limited(archive.extractfile(member), member.name)
+
+
+def take(iterator, count):
+    return list(itertools.islice(iterator, count))
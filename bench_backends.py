@@ -0,0 +1,102 @@
+"""Farkli model arka uclarinin gecikme, verim ve dogrulugunu karsilastirir.
+
+Dogruluk ilk modele (referans) gore olculur: ayni sinifta IoU >= 0.5 olan kutular eslesmis sayilir.
+Kullanim: python bench_backends.py yolov8n.pt yolov8n.onnx yolov8n_openvino_model --images tests/*.jpg
+"""
+import argparse
+import json
+import statistics
+import time
+import cv2
+from src.utils.inference_backend import load_detector, backend_name
+from src.utils.image_processor import extract_objects
+from src.utils.tracker import iou
+
+
+def percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q / 100 * (len(ordered) - 1))))]
+
+
+def match_counts(reference, candidate, threshold=0.5):
+    matched = 0
+    remaining = list(reference)
+    for detection in candidate:
+        for ref in remaining:
+            if ref["object_name"] == detection["object_name"] and iou(ref, detection) >= threshold:
+                remaining.remove(ref)
+                matched += 1
+                break
+    return matched
+
+
+def run_model(model, images, repeat, batch_size):
+    model(images[0], verbose=False)
+    latencies = []
+    outputs = []
+    for img in images:
+        for _ in range(repeat):
+            started = time.perf_counter()
+            result = model(img, verbose=False)[0]
+            latencies.append((time.perf_counter() - started) * 1000)
+        outputs.append(extract_objects(result, model.names))
+
+    started = time.perf_counter()
+    processed = 0
+    for _ in range(repeat):
+        for i in range(0, len(images), batch_size):
+            chunk = images[i:i + batch_size]
+            model(chunk, verbose=False)
+            processed += len(chunk)
+    throughput = processed / (time.perf_counter() - started)
+    return latencies, throughput, outputs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("models", nargs="+")
+    parser.add_argument("--images", nargs="+", required=True)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--batch", type=int, default=8)
+    parser.add_argument("--json", help="Sonuclarin yazilacagi JSON dosyasi")
+    args = parser.parse_args()
+
+    images = [img for img in (cv2.imread(path) for path in args.images) if img is not None]
+    if not images:
+        parser.error("Okunabilir goruntu bulunamadi")
+
+    report = []
+    reference = None
+    for model_path in args.models:
+        started = time.perf_counter()
+        model = load_detector(model_path)
+        load_ms = (time.perf_counter() - started) * 1000
+        latencies, throughput, outputs = run_model(model, images, args.repeat, args.batch)
+        if reference is None:
+            reference = outputs
+        matched = sum(match_counts(ref, out) for ref, out in zip(reference, outputs))
+        ref_total = sum(len(ref) for ref in reference)
+        out_total = sum(len(out) for out in outputs)
+        report.append({
+            "model": model_path,
+            "backend": backend_name(model_path),
+            "load_ms": load_ms,
+            "p50_ms": statistics.median(latencies),
+            "p95_ms": percentile(latencies, 95),
+            "images_per_sec": throughput,
+            "recall_vs_reference": matched / ref_total if ref_total else 1.0,
+            "precision_vs_reference": matched / out_total if out_total else 1.0,
+        })
+
+    print(f"{'model':32} {'arka uc':>10} {'yukleme':>9} {'p50 ms':>8} {'p95 ms':>8} {'goruntu/s':>10} {'recall':>7} {'precision':>9}")
+    for row in report:
+        print(f"{row['model'][-32:]:32} {row['backend']:>10} {row['load_ms']:9.0f} {row['p50_ms']:8.1f} "
+              f"{row['p95_ms']:8.1f} {row['images_per_sec']:10.1f} {row['recall_vs_reference']:7.3f} "
+              f"{row['precision_vs_reference']:9.3f}")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Kaydedilmis etiket goruntuleri klasorunde kargo OCR hattinin hizini olcer.
+
+Kullanim: python bench_cargo_ocr.py etiketler/ --backends tesseract pytesseract --compare-roi
+Her arka uc (ve istenirse on isleme acik/kapali) icin etiket basina ortalama sure,
+saniyedeki etiket sayisi ve uc alani da okunan etiket sayisi raporlanir.
+"""
+import argparse
+import glob
+import os
+import time
+import cv2
+from cargo_ocr import BILINMIYOR, PARTI_BOYUTU, get_backend, process_frames
+
+UZANTILAR = (".jpg", ".jpeg", ".png", ".bmp", ".tif", ".tiff")
+
+
+def load_images(klasor):
+    yollar = sorted(p for p in glob.glob(os.path.join(klasor, "*")) if p.lower().endswith(UZANTILAR))
+    return [(yol, kare) for yol, kare in ((yol, cv2.imread(yol)) for yol in yollar) if kare is not None]
+
+
+def run(kareler, motor, parti_boyutu, on_isleme):
+    tam = 0
+    baslangic = time.perf_counter()
+    for bilgi in process_frames(kareler, motor, parti_boyutu, on_isleme):
+        tam += BILINMIYOR not in bilgi[:3]
+    return time.perf_counter() - baslangic, tam
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("klasor")
+    parser.add_argument("--backends", nargs="+", default=["tesseract"])
+    parser.add_argument("--lang", default="tur")
+    parser.add_argument("--pool-size", type=int, default=2)
+    parser.add_argument("--batch", type=int, default=PARTI_BOYUTU)
+    parser.add_argument("--compare-roi", action="store_true", help="On isleme kapaliyken de olc")
+    args = parser.parse_args()
+
+    goruntuler = load_images(args.klasor)
+    if not goruntuler:
+        parser.error(f"{args.klasor}: goruntu bulunamadi")
+    kareler = [kare for _, kare in goruntuler]
+    print(f"{len(kareler)} etiket goruntusu")
+
+    print(f"{'arka uc':12} {'roi':>4} {'toplam s':>9} {'etiket/s':>9} {'ms/etiket':>10} {'tam okunan':>11}")
+    for ad in args.backends:
+        motor = get_backend(ad, args.lang, args.pool_size)
+        # Ilk cagri dil verisini yukler; olcume katilmaz
+        motor.recognize([kareler[0]])
+        for on_isleme in ([True, False] if args.compare_roi else [True]):
+            toplam, tam = run(kareler, motor, args.batch, on_isleme)
+            print(f"{ad:12} {'acik' if on_isleme else 'yok':>4} {toplam:9.2f} {len(kareler) / toplam:9.1f} "
+                  f"{toplam * 1000 / len(kareler):10.1f} {tam:5d}/{len(kareler):<5d}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Tam kare OCR ile bolge kapili OCR gecikmesini ve metin yakalama oranini karsilastirir.
+
+Yakalama orani: tam kare OCR'in okudugu metinlerden kapili modun da okuduklarinin orani.
+
+Kullanim: python bench_ocr_gate.py tests/*.jpg --repeat 3
+"""
+import argparse
+import statistics
+import time
+import cv2
+from src.utils.model_registry import registry
+from src.utils.image_processor import extract_objects
+from src.utils.ocr_gate import read_text_gated
+from src.config import OCR_TEXT_CLASSES
+
+
+def timed(fn, repeat):
+    durations = []
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        durations.append((time.perf_counter() - started) * 1000)
+    return statistics.median(durations), result
+
+
+def text_recall(reference, candidate):
+    expected = {text.strip().upper() for _, text, _ in reference if text.strip()}
+    if not expected:
+        return 1.0
+    found = {text.strip().upper() for _, text, _ in candidate}
+    return len(expected & found) / len(expected)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("images", nargs="+")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    registry.warm_up()
+    model, reader = registry.get_model(), registry.get_reader()
+
+    totals = {"full": [], "detector": [], "classes": []}
+    recalls = {"detector": [], "classes": []}
+    print(f"{'goruntu':40} {'full ms':>9} {'detector ms':>12} {'classes ms':>11} {'metin(full/det/cls)':>20} "
+          f"{'recall(det/cls)':>16}")
+    for path in args.images:
+        img = cv2.imread(path)
+        if img is None:
+            print(f"{path}: okunamadi, atlandi")
+            continue
+        objects = extract_objects(model(img, verbose=False)[0])
+        full_ms, full = timed(lambda: reader.readtext(img), args.repeat)
+        det_ms, det = timed(lambda: read_text_gated(reader, img, objects, "detector"), args.repeat)
+        cls_ms, cls = timed(lambda: read_text_gated(reader, img, objects, "classes", OCR_TEXT_CLASSES), args.repeat)
+        totals["full"].append(full_ms)
+        totals["detector"].append(det_ms)
+        totals["classes"].append(cls_ms)
+        recalls["detector"].append(text_recall(full, det))
+        recalls["classes"].append(text_recall(full, cls))
+        counts = f"{len(full)}/{len(det)}/{len(cls)}"
+        recall = f"{recalls['detector'][-1]:.2f}/{recalls['classes'][-1]:.2f}"
+        print(f"{path[-40:]:40} {full_ms:9.1f} {det_ms:12.1f} {cls_ms:11.1f} {counts:>20} {recall:>16}")
+
+    if totals["full"]:
+        print()
+        for mode, values in totals.items():
+            recall = f"  metin yakalama {statistics.mean(recalls[mode]):.2f}" if mode in recalls else ""
+            print(f"{mode:10} ortalama {statistics.mean(values):8.1f} ms  medyan {statistics.median(values):8.1f} ms{recall}")
+
+
+if __name__ == "__main__":
+    main()
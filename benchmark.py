@@ -0,0 +1,194 @@
+"""DroneVisionAI icin tekrarlanabilir benchmark ve yuk testi.
+
+  python benchmark.py stages --stub --images tests/*.jpg --json stages.json
+  DRONEVISION_STUB_MODELS=1 uvicorn src.main:app &
+  python benchmark.py load --url http://127.0.0.1:8000 --concurrency 1 4 16 --requests 200 --json load.json
+
+`stages` process_image asamalarini (cozme, cikarim, OCR, karolu cikarim, kalici yazma) ayri olcer.
+`load` /upload/ ve /detections/ uclarina farkli eszamanlilik seviyelerinde istek gonderir.
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import tempfile
+import time
+import uuid
+import cv2
+import numpy as np
+
+
+def percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q / 100 * (len(ordered) - 1))))]
+
+
+def summarize(latencies_ms):
+    return {
+        "count": len(latencies_ms),
+        "mean_ms": statistics.mean(latencies_ms),
+        "p50_ms": percentile(latencies_ms, 50),
+        "p95_ms": percentile(latencies_ms, 95),
+        "p99_ms": percentile(latencies_ms, 99),
+    }
+
+
+def load_images(paths):
+    images = [img for img in (cv2.imread(path) for path in paths or []) if img is not None]
+    if images:
+        return images
+    # Goruntu verilmezse sabit tohumla sentetik kareler uretilir; sonuclar tekrarlanabilir kalir
+    rng = np.random.default_rng(0)
+    for w, h in [(1280, 720), (1920, 1080), (3840, 2160)]:
+        img = rng.integers(60, 120, size=(h, w, 3), dtype=np.uint8)
+        cv2.putText(img, "KARGO 34 ABC 123", (w // 10, h // 5), cv2.FONT_HERSHEY_SIMPLEX, 2, (255, 255, 255), 4)
+        images.append(img)
+    return images
+
+
+def measure(fn, repeat):
+    latencies = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        latencies.append((time.perf_counter() - started) * 1000)
+    return latencies
+
+
+def run_stages(args):
+    from sqlalchemy.orm import sessionmaker
+    from src.models.detection import Base
+    from src.utils.model_registry import registry
+    from src.utils.image_processor import decode_image, extract_objects, extract_text, detect_tiled
+    from src.utils.db_engine import create_db_engine
+    from src.utils.db_manager import add_detections_bulk
+
+    if args.stub:
+        registry.reset(stub=True)
+    registry.warm_up()
+    model = registry.get_model()
+    images = load_images(args.images)
+
+    results = {}
+    for img in images:
+        label = f"{img.shape[1]}x{img.shape[0]}"
+        encoded = cv2.imencode(".jpg", img)[1].tobytes()
+        decoded, _ = decode_image(encoded)
+        objects = extract_objects(model(decoded, verbose=False)[0])
+        results[label] = {
+            "decode": summarize(measure(lambda: decode_image(encoded), args.repeat)),
+            "inference": summarize(measure(lambda: model(decoded, verbose=False), args.repeat)),
+            "ocr": summarize(measure(lambda: extract_text(decoded, objects), args.repeat)),
+            "tiled_inference": summarize(measure(lambda: detect_tiled(img), max(1, args.repeat // 5))),
+        }
+
+    fd, db_path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    try:
+        engine = create_db_engine(f"sqlite:///{db_path}")
+        Base.metadata.create_all(bind=engine)
+        db = sessionmaker(bind=engine)()
+        rows = [
+            {"object_name": "car", "confidence": 0.9, "x1": 0, "y1": 0, "x2": 10, "y2": 10, "timestamp": None}
+            for _ in range(args.rows)
+        ]
+        results["persistence"] = {
+            f"bulk_{args.rows}_rows": summarize(measure(lambda: add_detections_bulk(db, [dict(r) for r in rows]), args.repeat)),
+        }
+        db.close()
+        engine.dispose()
+    finally:
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(db_path + suffix):
+                os.remove(db_path + suffix)
+
+    for label, stages in results.items():
+        for stage, summary in stages.items():
+            print(f"{label:12} {stage:22} p50 {summary['p50_ms']:9.2f} ms  p95 {summary['p95_ms']:9.2f} ms  "
+                  f"p99 {summary['p99_ms']:9.2f} ms")
+    return {"backend": registry.backend, "repeat": args.repeat, "stages": results}
+
+
+async def run_level(concurrency, total, send):
+    latencies = []
+    errors = 0
+    remaining = total
+
+    async def worker():
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            started = time.perf_counter()
+            try:
+                ok = await send()
+            except Exception:
+                ok = False
+            latencies.append((time.perf_counter() - started) * 1000)
+            errors += not ok
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    return {"concurrency": concurrency, "requests": total, "errors": errors,
+            "throughput_rps": total / elapsed, **summarize(latencies)}
+
+
+async def run_load(args):
+    import httpx
+
+    payload = cv2.imencode(".jpg", load_images(args.images)[0])[1].tobytes()
+    report = {}
+    async with httpx.AsyncClient(base_url=args.url, timeout=args.timeout) as client:
+        async def upload():
+            # JPEG bitisinden sonra eklenen baytlar cozumu etkilemez ama onbellek anahtarini degistirir
+            body = payload if args.repeat_frames else payload + uuid.uuid4().bytes
+            response = await client.post("/upload/", files={"file": ("frame.jpg", body, "image/jpeg")})
+            return response.status_code == 200
+
+        async def detections():
+            response = await client.get("/detections/", params={"limit": 100})
+            return response.status_code == 200
+
+        for name, send in (("upload", upload), ("detections", detections)):
+            report[name] = []
+            for concurrency in args.concurrency:
+                level = await run_level(concurrency, args.requests, send)
+                report[name].append(level)
+                print(f"{name:11} c={concurrency:<4} {level['throughput_rps']:8.1f} istek/s  p50 {level['p50_ms']:8.1f} ms  "
+                      f"p95 {level['p95_ms']:8.1f} ms  p99 {level['p99_ms']:8.1f} ms  hata {level['errors']}")
+    return {"url": args.url, "repeat_frames": args.repeat_frames, "load": report}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    stages = sub.add_parser("stages", help="process_image asamalarinin mikro benchmarklari")
+    stages.add_argument("--images", nargs="*")
+    stages.add_argument("--repeat", type=int, default=20)
+    stages.add_argument("--rows", type=int, default=50, help="Kalici yazma testinde parti basina satir")
+    stages.add_argument("--stub", action="store_true", help="Gercek modeller yerine stub modeller")
+    stages.add_argument("--json")
+
+    load = sub.add_parser("load", help="HTTP yuk testi")
+    load.add_argument("--url", default="http://127.0.0.1:8000")
+    load.add_argument("--images", nargs="*")
+    load.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16, 64])
+    load.add_argument("--requests", type=int, default=200, help="Her seviyede gonderilecek istek")
+    load.add_argument("--timeout", type=float, default=60.0)
+    load.add_argument("--repeat-frames", action="store_true", help="Ayni kareyi gonder (onbellek isabeti olcumu)")
+    load.add_argument("--json")
+    args = parser.parse_args()
+
+    report = run_stages(args) if args.command == "stages" else asyncio.run(run_load(args))
+    report["meta"] = {"python": platform.python_version(), "machine": platform.machine(),
+                      "cpu_count": os.cpu_count(), "time": time.strftime("%Y-%m-%dT%H:%M:%S")}
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+"""
+Kargo etiketi OCR servisi.
+
+CAMO betiklerinin ortak kullandigi etiket hattini tek yerde toplar:
+on isleme (label_roi), OCR arka ucu (ocr_engine veya `recognize(goruntuler)`
+sunan herhangi bir nesne), etiket metni ayristirma ve kayit depolari.
+
+Kullanim:
+    for bilgi in process_frames(kareler, motor=get_backend("tesseract", "tur")):
+        print(bilgi.isim, bilgi.soyisim, bilgi.adres)
+"""
+
+import heapq
+import itertools
+import logging
+import os
+from collections import Counter, namedtuple
+from datetime import datetime
+
+import cv2
+
+from label_roi import etiket_hazirla
+from ocr_engine import get_engine
+
+logger = logging.getLogger(__name__)
+
+BILINMIYOR = "BILINMIYOR"
+ETIKET_DILI = "tur"
+PARTI_BOYUTU = 8  # process_frames'in OCR motoruna tek seferde verdigi kare sayisi
+PUANLAMA_GENISLIGI = 320  # kare puanlamasi icin kare bu genislige kucultulur
+
+EtiketBilgisi = namedtuple("EtiketBilgisi", ["isim", "soyisim", "adres", "metin"])
+
+# --- Ayristirma ---
+
+def etiket_metni_coz(ocr_metin):
+    """
+    OCR'den gelen metni isleyip isim, soyisim, adres bilgilerini cekmeye calisir
+    Basit kural tabanli ayristirma. Gercek etiket formati degisebilir, uyarlayin.
+    """
+    satirlar = [satir.strip() for satir in ocr_metin.split('\n') if satir.strip()]
+    isim = soyisim = adres = BILINMIYOR
+    for satir in satirlar:
+        # "İ".lower() noktali i + birlestirici nokta verir; once duz I'ya cevrilir
+        kucuk = satir.replace("İ", "I").lower()
+        deger = satir.split(":", 1)[-1].strip()
+        # "soyisim" "isim" kelimesini de icerdigi icin once kontrol edilir
+        if "soyisim" in kucuk:
+            if soyisim == BILINMIYOR:
+                soyisim = deger
+        elif "isim" in kucuk:
+            if isim == BILINMIYOR:
+                isim = deger
+        elif "adres" in kucuk and adres == BILINMIYOR:
+            adres = deger
+    return isim, soyisim, adres
+
+def alanlari_birlestir(cozumler):
+    """
+    Aday karelerden cozulen (isim, soyisim, adres) degerlerini alan bazinda cogunluk oyuyla birlestirir.
+    Esitlikte daha yuksek puanli (listede once gelen) karenin degeri secilir.
+    """
+    sonuc = []
+    for degerler in zip(*cozumler):
+        okunan = [deger for deger in degerler if deger != BILINMIYOR]
+        if not okunan:
+            sonuc.append(BILINMIYOR)
+            continue
+        sayilar = Counter(okunan)
+        sonuc.append(max(okunan, key=lambda deger: sayilar[deger]))
+    return tuple(sonuc)
+
+# --- Kare secimi ---
+
+def kare_puani(kare):
+    """
+    Karenin etiket OCR'ine uygunlugunu ucuzca puanlar.
+    Kucultulmus gri karede Laplace varyansi (netlik), en buyuk parlak dortgenin
+    (etiket adayi) kare alanina oraniyla agirliklandirilir.
+    """
+    yukseklik, genislik = kare.shape[:2]
+    olcek = PUANLAMA_GENISLIGI / genislik
+    kucuk = cv2.resize(kare, (PUANLAMA_GENISLIGI, max(1, int(yukseklik * olcek))), interpolation=cv2.INTER_AREA)
+    gri = cv2.cvtColor(kucuk, cv2.COLOR_BGR2GRAY) if kucuk.ndim == 3 else kucuk
+    keskinlik = cv2.Laplacian(gri, cv2.CV_64F).var()
+
+    _, maske = cv2.threshold(gri, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+    konturlar, _ = cv2.findContours(maske, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+    etiket_orani = 0.0
+    for kontur in konturlar:
+        cevre = cv2.arcLength(kontur, True)
+        if len(cv2.approxPolyDP(kontur, 0.02 * cevre, True)) == 4:
+            etiket_orani = max(etiket_orani, cv2.contourArea(kontur) / gri.size)
+    # Etiket gorunmeyen net kareler tamamen elenmez, yalnizca geriye duser
+    return keskinlik * (0.1 + etiket_orani)
+
+class EtiketKareSecici:
+    """
+    Kayit boyunca en yuksek puanli `aday_sayisi` kareyi min-heap'te tutar.
+    Kare yalnizca aday kumesine girerken kopyalanir; diger kareler icin bellek ayrilmaz.
+    """
+    def __init__(self, aday_sayisi=3, aralik=1):
+        self.aday_sayisi = aday_sayisi
+        self.aralik = aralik
+        self._adaylar = []
+        self._sira = 0
+
+    def degerlendir(self, kare):
+        self._sira += 1
+        if self._sira % self.aralik:
+            return
+        puan = kare_puani(kare)
+        if len(self._adaylar) < self.aday_sayisi:
+            heapq.heappush(self._adaylar, (puan, self._sira, kare.copy()))
+        elif puan > self._adaylar[0][0]:
+            heapq.heapreplace(self._adaylar, (puan, self._sira, kare.copy()))
+
+    def adaylar(self):
+        """Aday kareleri puana gore azalan sirada dondurur."""
+        return [kare for _, _, kare in sorted(self._adaylar, key=lambda aday: aday[:2], reverse=True)]
+
+# --- OCR arka uclari ---
+
+class PytesseractBackend:
+    """Her goruntu icin ayri `tesseract` sureci acar; karsilastirma ve tesserocr olmayan ortamlar icin."""
+    def __init__(self, lang=ETIKET_DILI):
+        self.lang = lang
+
+    def recognize(self, images):
+        import pytesseract
+        return [pytesseract.image_to_string(image, lang=self.lang) for image in images]
+
+def get_backend(ad="tesseract", lang=ETIKET_DILI, havuz_boyutu=2):
+    """Ada gore OCR arka ucu dondurur: "tesseract" (kalici motor havuzu) veya "pytesseract"."""
+    if ad == "tesseract":
+        return get_engine(lang, havuz_boyutu)
+    if ad == "pytesseract":
+        return PytesseractBackend(lang)
+    raise ValueError(f"Bilinmeyen OCR arka ucu: {ad}")
+
+# --- Hat ---
+
+def on_isle(kare):
+    """Etiket bolgesini kirpip esikler; bulunamazsa tum kare esiklenir."""
+    goruntu, koseler = etiket_hazirla(kare)
+    if koseler is None:
+        logger.debug("Etiket bölgesi bulunamadı, tüm kare okunuyor.")
+    return goruntu
+
+def _motor(motor):
+    return motor if motor is not None else get_backend()
+
+def etiket_oku(kareler, motor=None, on_isleme=True):
+    """
+    Ayni paketin aday karelerini (en iyisi basta) okur ve alanlari birlestirir.
+    Metin olarak ilk karenin OCR ciktisi dondurulur. Aday kare yoksa tum alanlar BILINMIYOR olur.
+    """
+    kareler = list(kareler)
+    if not kareler:
+        return EtiketBilgisi(BILINMIYOR, BILINMIYOR, BILINMIYOR, "")
+    goruntuler = [on_isle(kare) for kare in kareler] if on_isleme else kareler
+    metinler = _motor(motor).recognize(goruntuler)
+    isim, soyisim, adres = alanlari_birlestir([etiket_metni_coz(metin) for metin in metinler])
+    return EtiketBilgisi(isim, soyisim, adres, metinler[0] if metinler else "")
+
+def process_frames(kareler, motor=None, parti_boyutu=PARTI_BOYUTU, on_isleme=True, depo=None):
+    """
+    Kare akisini parti parti OCR'den gecirir ve her kare icin sirayla EtiketBilgisi verir.
+    `kareler` herhangi bir yineleyici olabilir (kamera, video, dosya listesi); tamami bellege alinmaz.
+    `depo` verilirse her sonuc `depo.kaydet` ile kaydedilir.
+    """
+    motor = _motor(motor)
+    kareler = iter(kareler)
+    while parti := list(itertools.islice(kareler, parti_boyutu)):
+        goruntuler = [on_isle(kare) for kare in parti] if on_isleme else parti
+        for metin in motor.recognize(goruntuler):
+            bilgi = EtiketBilgisi(*etiket_metni_coz(metin), metin)
+            if depo is not None:
+                depo.kaydet(bilgi)
+            yield bilgi
+
+# --- Kayit depolari ---
+
+class TextDosyasiDeposu:
+    """Her etiketi klasore `isim_soyisim_tarih.txt` olarak yazar."""
+    def __init__(self, klasor):
+        self.klasor = klasor
+        os.makedirs(klasor, exist_ok=True)
+
+    def kaydet(self, bilgi, tarih_str=None):
+        tarih_str = tarih_str or datetime.now().strftime("%Y%m%d_%H%M%S")
+        dosya_adi = os.path.join(self.klasor, f"{bilgi.isim}_{bilgi.soyisim}_{tarih_str}.txt")
+        with open(dosya_adi, 'w', encoding='utf-8') as f:
+            f.write(f"Isim: {bilgi.isim}\n")
+            f.write(f"Soyisim: {bilgi.soyisim}\n")
+            f.write(f"Adres: {bilgi.adres}\n")
+            f.write(f"Tarih: {tarih_str}\n")
+        logger.info(f"Bilgi kaydedildi: {dosya_adi}")
+        return dosya_adi
+
+class SqlServerDeposu:
+    """Etiketleri SQL Server'daki PersonInfo tablosuna yazar (pyodbc gerekir)."""
+    def __init__(self, baglanti_dizesi):
+        self.baglanti_dizesi = baglanti_dizesi
+
+    def kaydet(self, bilgi):
+        import pyodbc
+        conn = pyodbc.connect(self.baglanti_dizesi)
+        try:
+            cursor = conn.cursor()
+            query = "INSERT INTO PersonInfo (Name, Surname, Address, Timestamp) VALUES (?, ?, ?, ?)"
+            cursor.execute(query, (bilgi.isim, bilgi.soyisim, bilgi.adres, datetime.now()))
+            conn.commit()
+            logger.info("Kişi bilgileri veri tabanına kaydedildi.")
+        finally:
+            conn.close()
@@ -0,0 +1,28 @@
+import cv2
+from ..config import CASCADE_MODE, CASCADE_SIZE, CASCADE_GRID, CASCADE_EDGE_THRESHOLD
+
+
+def edge_density_grid(img, size=CASCADE_SIZE, grid=CASCADE_GRID):
+    """Karenin kucultulmus gri kopyasinda hucre basina Canny kenar pikseli oranini dondurur."""
+    h, w = img.shape[:2]
+    scale = min(1.0, size / max(h, w))
+    small = cv2.resize(img, (max(grid, round(w * scale)), max(grid, round(h * scale))), interpolation=cv2.INTER_AREA)
+    gray = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY) if small.ndim == 3 else small
+    edges = cv2.Canny(gray, 50, 150) > 0
+    gh = edges.shape[0] // grid * grid
+    gw = edges.shape[1] // grid * grid
+    cells = edges[:gh, :gw].reshape(grid, gh // grid, grid, gw // grid)
+    return cells.mean(axis=(1, 3))
+
+
+def needs_detector(img, mode=CASCADE_MODE, threshold=CASCADE_EDGE_THRESHOLD):
+    """Kaskadin ilk asamasi: kare tam dedektore gitmeli mi?
+
+    "edges" modunda herhangi bir hucrede yeterli kenar yoksa (bos gokyuzu, duz tarla)
+    kare atlanir. Tek hucreye bakilmasi kucuk nesnelerin ortalamada kaybolmasini onler.
+    """
+    if mode == "off":
+        return True
+    if mode == "edges":
+        return edge_density_grid(img).max() >= threshold
+    raise ValueError(f"Bilinmeyen kaskad modu: {mode}")
@@ -1,13 +1,129 @@
-# Model yapılandırmaları
-MODEL_PATH = "yolov8n.pt"
-
-# Veritabanı yapılandırmaları
-DB_URL = "sqlite:///detection.db"
-
-# OCR yapılandırmaları
-ALLOWED_LANGUAGES = ['en']
-
-# API ayarları
-API_TITLE = "DroneVisionAI API"
-API_DESCRIPTION = "İHA'lar için görüntü işleme ve nesne tanıma API'si"
-API_VERSION = "0.1.0"
\ No newline at end of file
+import os
+
+# Model yapılandırmaları
+# Uzantı arka ucu belirler: .pt (PyTorch), .onnx (ONNX Runtime), *_openvino_model/ (OpenVINO)
+MODEL_PATH = "yolov8n.pt"
+# Testler ve yük testleri için gerçek modeller yerine deterministik stub modeller
+USE_STUB_MODELS = os.environ.get("DRONEVISION_STUB_MODELS") == "1"
+STUB_MODEL_DELAY_MS = int(os.environ.get("DRONEVISION_STUB_DELAY_MS", "0"))
+
+# Veritabanı yapılandırmaları
+DB_URL = "sqlite:///detection.db"
+DB_ECHO = False
+# SQLite bağlantı ayarları; WAL sayesinde okuyucular yazıcıyı beklemez
+SQLITE_BUSY_TIMEOUT_MS = 5000
+SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "busy_timeout": SQLITE_BUSY_TIMEOUT_MS,
+    "cache_size": -64000,
+    "mmap_size": 256 * 1024 * 1024,
+    "temp_store": "MEMORY",
+}
+
+# OCR yapılandırmaları
+ALLOWED_LANGUAGES = ['en']
+# "full": tüm kare EasyOCR'a verilir, "gated": yalnızca metin adayı bölgeler tanınır.
+# "gated" dikey ve çok büyük yazıları kaçırabilir; açmadan önce bench_ocr_gate.py ile metin
+# yakalama oranı kontrol edilmeli
+OCR_MODE = "full"
+# "detector": ucuz morfolojik metin dedektörü, "classes": yalnızca OCR_TEXT_CLASSES kutularının içi
+OCR_GATE_SOURCE = "detector"
+OCR_TEXT_CLASSES = ["stop sign", "truck", "bus", "car", "train", "boat"]
+OCR_GATE_MAX_SIDE = 1280
+OCR_GATE_MAX_REGIONS = 32
+OCR_GATE_PADDING = 4
+OCR_BATCH_SIZE = 16
+
+# API ayarları
+API_TITLE = "DroneVisionAI API"
+API_DESCRIPTION = "İHA'lar için görüntü işleme ve nesne tanıma API'si"
+API_VERSION = "0.1.0"
+
+# Toplu çıkarım ayarları
+BATCH_MAX_SIZE = 8
+BATCH_MAX_WAIT_MS = 5
+
+# Toplu yükleme ayarları (/upload/batch/; tek tek görüntüler veya zip/tar arşivleri)
+BATCH_UPLOAD_MAX_IMAGES = 1000
+BATCH_UPLOAD_MAX_MEMBER_BYTES = 50 * 1024 * 1024
+BATCH_UPLOAD_EXTENSIONS = (".jpg", ".jpeg", ".png", ".bmp", ".tif", ".tiff", ".webp")
+
+# İş kuyruğu ayarları (/jobs/; uzun süren yüklemeler arka planda işlenir)
+JOB_DB_PATH = "jobs.db"
+JOB_DIR = "jobs"
+# API ile birlikte başlatılan işçi süreç sayısı; 0 ise işçiler ayrı çalıştırılır (run_job_workers.py)
+JOB_WORKERS = 1
+JOB_POLL_INTERVAL = 0.5
+# Çalışan işçi kirasını JOB_HEARTBEAT_INTERVAL saniyede bir yeniler; JOB_STALE_SECONDS
+# boyunca yenilenmeyen işler çökmüş sayılır ve yeniden kuyruğa alınır
+JOB_HEARTBEAT_INTERVAL = 15
+JOB_STALE_SECONDS = 120
+JOB_WAIT_MAX_SECONDS = 30
+
+# Çalıştırma ayarları ("thread" veya "process")
+EXECUTOR_KIND = "thread"
+EXECUTOR_WORKERS = 2
+MAX_PENDING_REQUESTS = 64
+
+# Model ısındırma ayarları
+WARMUP_IMAGE_SIZE = 640
+
+# Dışa aktarma ayarları
+EXPORT_BATCH_SIZE = 5000
+
+# Sonuç önbelleği ayarları (CACHE_DIR None ise yalnızca bellek kullanılır)
+CACHE_VERSION = "1"
+CACHE_MAX_ENTRIES = 1024
+CACHE_DIR = None
+CACHE_TTL_SECONDS = 24 * 60 * 60
+CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+# Video işleme ayarları
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+VIDEO_FRAME_STRIDE = 2
+# 32x32 gri küçük resimlerde ortalama piksel farkı bu değerin altındaysa kare atlanır
+VIDEO_DIFF_THRESHOLD = 4.0
+VIDEO_MAX_SKIP = 30
+# Videolar çıkarım havuzundan ayrı, sınırlı bir havuzda işlenir; dolunca 503 döner
+VIDEO_WORKERS = 1
+VIDEO_MAX_PENDING = 2
+VIDEO_MAX_UPLOAD_BYTES = 2 * 1024 * 1024 * 1024
+TRACK_IOU_THRESHOLD = 0.3
+TRACK_MAX_MISSED = 5
+
+# Görüntü çözme ayarları
+UPLOAD_BUFFER_POOL_SIZE = 8
+# Bu boyutu aşan yükleme tamponları havuzda tutulmaz; büyük yüklemeler kalıcı bellek ayırmaz
+UPLOAD_BUFFER_MAX_BYTES = 16 * 1024 * 1024
+# Büyük JPEG'ler IMREAD_REDUCED_* ile en uzun kenarı bu değerin altına düşmeyecek şekilde küçültülerek çözülür
+REDUCED_DECODE = True
+DECODE_TARGET_SIZE = 1280
+
+# Karolu çıkarım ayarları (yüksek irtifa 4K+ kareler için)
+TILED_INFERENCE = False
+TILE_SIZE = 640
+TILE_OVERLAP = 0.2
+# Küçük kutuya göre kesişim bu değeri aşarsa karolar arası kutular birleştirilir
+TILE_MERGE_THRESHOLD = 0.6
+TILE_INCLUDE_FULL_FRAME = True
+
+# Kaskad ayarları: ucuz ilk aşama boş kareleri (gökyüzü, tarla) tam dedektöre göndermez ("off" veya "edges")
+CASCADE_MODE = "off"
+CASCADE_SIZE = 320
+CASCADE_GRID = 8
+# Herhangi bir hücrenin kenar pikseli oranı bu değerin altındaysa kare boş sayılır
+CASCADE_EDGE_THRESHOLD = 0.01
+
+# Async veritabanı havuzu (Postgres; SQLite için kullanılmaz)
+DB_POOL_SIZE = 10
+DB_MAX_OVERFLOW = 20
+DB_POOL_TIMEOUT = 30
+
+# Parquet arşivi (gün bazlı bölümler); sıcak tabloda yalnızca son günler tutulur
+ARCHIVE_DIR = "archive"
+HOT_RETENTION_DAYS = 7
+
+# Gözlemlenebilirlik
+# Açıksa /upload/ yanıtlarına aşama sürelerini içeren Server-Timing başlığı eklenir
+SERVER_TIMING = True
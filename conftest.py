@@ -0,0 +1,12 @@
+import pytest
+from src.utils.model_registry import registry
+
+@pytest.fixture
+def stub_registry():
+    # Paylasilan registry stub modellere gecirilir; test bitince onceki hazir durum geri yuklenir
+    was_ready = registry.ready
+    registry.reset(stub=True)
+    yield registry
+    registry.reset()
+    if was_ready:
+        registry.warm_up()
@@ -0,0 +1,46 @@
+import threading
+from sqlalchemy import create_engine, event
+from ..config import DB_URL, DB_ECHO, SQLITE_PRAGMAS, SQLITE_BUSY_TIMEOUT_MS
+
+_engine = None
+_lock = threading.Lock()
+
+
+def is_sqlite(url):
+    return url.split(":", 1)[0].split("+", 1)[0] == "sqlite"
+
+
+def apply_sqlite_pragmas(engine, pragmas=SQLITE_PRAGMAS):
+    """Her yeni SQLite baglantisinda PRAGMA ayarlarini uygular.
+
+    WAL modunda okuyucular yaziciyi beklemez; synchronous=NORMAL WAL ile guvenlidir ve
+    her commit'te fsync yapmaz. Async motorlar icin `engine.sync_engine` verilmelidir.
+    """
+    @event.listens_for(engine, "connect")
+    def set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+    return engine
+
+
+def create_db_engine(url=DB_URL, echo=DB_ECHO, **options):
+    if is_sqlite(url):
+        connect_args = options.setdefault("connect_args", {})
+        connect_args.setdefault("timeout", SQLITE_BUSY_TIMEOUT_MS / 1000)
+        # Oturumlar thread havuzu ile istek thread'i arasinda gecebilir
+        connect_args.setdefault("check_same_thread", False)
+    engine = create_engine(url, echo=echo, **options)
+    if is_sqlite(url):
+        apply_sqlite_pragmas(engine)
+    return engine
+
+
+def get_engine():
+    # Model ve yonetici modulleri ayni baglanti havuzunu paylasir
+    global _engine
+    with _lock:
+        if _engine is None:
+            _engine = create_db_engine()
+    return _engine
@@ -1,26 +1,95 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from ..models.detection import Base, Detection
-
-engine = create_engine("sqlite:///detection.db", echo=True)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-
-def init_db():
-    Base.metadata.create_all(bind=engine)
-
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-def add_detection(db, detection_data):
-    detection = Detection(**detection_data)
-    db.add(detection)
-    db.commit()
-    db.refresh(detection)
-    return detection
-
-def get_all_detections(db):
-    return db.query(Detection).all()
+import base64
+from datetime import datetime
+from sqlalchemy import select, tuple_
+from sqlalchemy.orm import sessionmaker
+from ..models.detection import Base, Detection
+from .db_engine import get_engine
+
+engine = get_engine()
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+def init_db():
+    Base.metadata.create_all(bind=engine)
+    # create_all mevcut tablolara yeni indeksleri eklemez
+    for index in Detection.__table__.indexes:
+        index.create(bind=engine, checkfirst=True)
+
+def get_db():
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+def add_detection(db, detection_data):
+    detection = Detection(**detection_data)
+    db.add(detection)
+    db.commit()
+    db.refresh(detection)
+    return detection
+
+def add_detections_bulk(db, detections):
+    # Tum satirlar tek transaction ve tek commit ile yazilir; ORM nesnesi uretilmez
+    if not detections:
+        return 0
+    try:
+        db.bulk_insert_mappings(Detection, detections)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    return len(detections)
+
+def get_all_detections(db):
+    return db.query(Detection).all()
+
+def detection_to_dict(detection):
+    return {
+        "id": detection.id,
+        "object_name": detection.object_name,
+        "confidence": detection.confidence,
+        "text": detection.text,
+        "x1": detection.x1,
+        "y1": detection.y1,
+        "x2": detection.x2,
+        "y2": detection.y2,
+        "timestamp": detection.timestamp,
+    }
+
+def encode_cursor(detection):
+    raw = f"{detection.timestamp.isoformat()}|{detection.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+def decode_cursor(cursor):
+    try:
+        timestamp, detection_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(timestamp), int(detection_id)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError("Geçersiz cursor") from e
+
+def filter_detections(query, object_name=None, min_confidence=None, start=None, end=None):
+    if object_name is not None:
+        query = query.filter(Detection.object_name == object_name)
+    if min_confidence is not None:
+        query = query.filter(Detection.confidence >= min_confidence)
+    if start is not None:
+        query = query.filter(Detection.timestamp >= start)
+    if end is not None:
+        query = query.filter(Detection.timestamp < end)
+    return query
+
+def detections_page_statement(limit=100, cursor=None, object_name=None, min_confidence=None, start=None, end=None):
+    # En yeni kayittan geriye keyset sayfalama; OFFSET kullanilmadigi icin tablo boyutundan bagimsiz
+    statement = filter_detections(select(Detection), object_name, min_confidence, start, end)
+    if cursor is not None:
+        statement = statement.filter(tuple_(Detection.timestamp, Detection.id) < decode_cursor(cursor))
+    # Sonraki sayfa olup olmadigini anlamak icin bir fazla satir okunur
+    return statement.order_by(Detection.timestamp.desc(), Detection.id.desc()).limit(limit + 1)
+
+def detections_page(rows, limit):
+    next_cursor = encode_cursor(rows[limit - 1]) if len(rows) > limit else None
+    return rows[:limit], next_cursor
+
+def get_detections(db, limit=100, cursor=None, object_name=None, min_confidence=None, start=None, end=None):
+    statement = detections_page_statement(limit, cursor, object_name, min_confidence, start, end)
+    return detections_page(db.execute(statement).scalars().all(), limit)
@@ -1,18 +1,25 @@
-from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, Text
-from sqlalchemy.ext.declarative import declarative_base
-from datetime import datetime
-
-Base = declarative_base()
-engine = create_engine("sqlite:///detection.db", echo=True)
-
-class Detection(Base):
-    __tablename__ = "detections"
-    id = Column(Integer, primary_key=True, index=True)
-    object_name = Column(String, nullable=True)
-    confidence = Column(Float, nullable=True)
-    text = Column(Text, nullable=True)
-    x1 = Column(Integer)
-    y1 = Column(Integer)
-    x2 = Column(Integer)
-    y2 = Column(Integer)
-    timestamp = Column(DateTime, default=datetime.now)
+from sqlalchemy import Column, Integer, String, Float, DateTime, Text, Index
+from sqlalchemy.ext.declarative import declarative_base
+from datetime import datetime
+from ..utils.db_engine import get_engine
+
+Base = declarative_base()
+engine = get_engine()
+
+class Detection(Base):
+    __tablename__ = "detections"
+    id = Column(Integer, primary_key=True, index=True)
+    object_name = Column(String, nullable=True)
+    confidence = Column(Float, nullable=True)
+    text = Column(Text, nullable=True)
+    x1 = Column(Integer)
+    y1 = Column(Integer)
+    x2 = Column(Integer)
+    y2 = Column(Integer)
+    timestamp = Column(DateTime, default=datetime.now)
+
+    # GET /detections/ keyset sayfalamasi (timestamp, id) sirasiyla ilerler
+    __table_args__ = (
+        Index("ix_detections_timestamp_id", "timestamp", "id"),
+        Index("ix_detections_object_name_timestamp_id", "object_name", "timestamp", "id"),
+    )
@@ -0,0 +1,129 @@
+import os
+from collections import defaultdict
+from datetime import datetime, time, timedelta
+from itertools import islice
+from ..models.detection import Detection
+from .db_manager import filter_detections
+from .exporter import EXPORT_FIELDS, arrow_schema
+from ..config import ARCHIVE_DIR, HOT_RETENTION_DAYS, EXPORT_BATCH_SIZE
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+
+def _require_pyarrow():
+    if pa is None:
+        raise RuntimeError("Parquet arşivi için pyarrow kurulu olmalı")
+
+
+def partition_dir(day, archive_dir=ARCHIVE_DIR):
+    return os.path.join(archive_dir, f"date={day.isoformat()}")
+
+
+def archive_cutoff(now=None, retention_days=HOT_RETENTION_DAYS):
+    # Yalnizca tamamlanmis gunler arsivlenir; kesim noktasi her zaman gece yarisidir
+    today = (now or datetime.now()).date()
+    return datetime.combine(today - timedelta(days=retention_days), time.min)
+
+
+def archive_detections(db, cutoff=None, archive_dir=ARCHIVE_DIR, batch_size=EXPORT_BATCH_SIZE):
+    """`cutoff` oncesi tespitleri gun bazli Parquet bolumlerine tasir ve sicak tablodan siler.
+
+    Satirlar yield_per ile parti parti okunur; her gun icin acik bir ParquetWriter tutulur.
+    Dosyalar once gecici adla yazilir, tamamlaninca yeniden adlandirilir ve satirlar ancak
+    bundan sonra silinir. Dosya adi gunun ilk tespit id'sinden gelir; silme basarisiz olursa
+    sonraki calisma ayni dosyayi yeniden yazar, satirlar iki kez arsivlenmez. Hata olursa
+    gecici dosyalar silinir. Yazilan satir sayisi dondurulur.
+    """
+    _require_pyarrow()
+    cutoff = cutoff or archive_cutoff()
+    schema = arrow_schema()
+    writers = {}
+    paths = {}
+    archived = 0
+    max_id = None
+    completed = False
+    try:
+        columns = [getattr(Detection, field) for field in EXPORT_FIELDS]
+        query = filter_detections(db.query(*columns), end=cutoff).order_by(Detection.id)
+        rows = iter(query.yield_per(batch_size))
+        while True:
+            batch = list(islice(rows, batch_size))
+            if not batch:
+                break
+            by_day = defaultdict(list)
+            for row in batch:
+                by_day[row.timestamp.date()].append(row)
+            for day, day_rows in by_day.items():
+                if day not in writers:
+                    directory = partition_dir(day, archive_dir)
+                    os.makedirs(directory, exist_ok=True)
+                    paths[day] = os.path.join(directory, f"part-{day_rows[0].id:012d}.parquet")
+                    writers[day] = pq.ParquetWriter(paths[day] + ".tmp", schema)
+                columns_data = list(zip(*day_rows))
+                writers[day].write_table(pa.table(
+                    [pa.array(values, type=field.type) for values, field in zip(columns_data, schema)],
+                    schema=schema,
+                ))
+            archived += len(batch)
+            max_id = batch[-1].id
+        completed = True
+    finally:
+        for writer in writers.values():
+            writer.close()
+        if not completed:
+            for path in paths.values():
+                _remove(path + ".tmp")
+
+    for path in paths.values():
+        os.replace(path + ".tmp", path)
+    if max_id is not None:
+        db.query(Detection).filter(Detection.timestamp < cutoff, Detection.id <= max_id).delete(synchronize_session=False)
+        db.commit()
+    return archived
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def archived_partitions(start, end, archive_dir=ARCHIVE_DIR):
+    # Yalnizca sorgu araligindaki gun klasorleri taranir; diger bolumler hic acilmaz
+    day = start.date()
+    partitions = []
+    while datetime.combine(day, time.min) < end:
+        directory = partition_dir(day, archive_dir)
+        if os.path.isdir(directory):
+            partitions.extend(
+                os.path.join(directory, name) for name in sorted(os.listdir(directory)) if name.endswith(".parquet")
+            )
+        day += timedelta(days=1)
+    return partitions
+
+
+def query_archive(start, end, columns=None, object_name=None, archive_dir=ARCHIVE_DIR):
+    _require_pyarrow()
+    files = archived_partitions(start, end, archive_dir)
+    if not files:
+        return arrow_schema().empty_table().select(columns or EXPORT_FIELDS)
+    condition = (ds.field("timestamp") >= pa.scalar(start, pa.timestamp("us"))) & \
+        (ds.field("timestamp") < pa.scalar(end, pa.timestamp("us")))
+    if object_name is not None:
+        condition &= ds.field("object_name") == object_name
+    return ds.dataset(files, schema=arrow_schema(), format="parquet").to_table(columns=columns, filter=condition)
+
+
+def count_per_hour(object_name, start, end, archive_dir=ARCHIVE_DIR):
+    """Ornek: son ayda saat basina kamyon sayisi -> [(saat, adet), ...]."""
+    table = query_archive(start, end, columns=["timestamp"], object_name=object_name, archive_dir=archive_dir)
+    hours = pc.floor_temporal(table["timestamp"], unit="hour")
+    counts = pa.table({"hour": hours}).group_by("hour").aggregate([("hour", "count")]).sort_by("hour")
+    return list(zip(counts["hour"].to_pylist(), counts["hour_count"].to_pylist()))
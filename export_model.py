@@ -0,0 +1,22 @@
+"""YOLO modelini CPU arka uclari icin ONNX veya OpenVINO'ya aktarir.
+
+Kullanim: python export_model.py --format openvino --int8
+Cikan yol config.MODEL_PATH olarak ayarlanabilir.
+"""
+import argparse
+from src.config import MODEL_PATH
+from src.utils.inference_backend import export_model
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--source", default=MODEL_PATH)
+    parser.add_argument("--format", choices=["onnx", "openvino"], default="onnx")
+    parser.add_argument("--int8", action="store_true")
+    parser.add_argument("--imgsz", type=int, default=640)
+    args = parser.parse_args()
+    print(export_model(args.source, args.format, args.int8, args.imgsz))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+import csv
+import io
+import json
+from itertools import islice
+from ..models.detection import Detection
+from .db_manager import SessionLocal, filter_detections
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+EXPORT_FIELDS = ["id", "object_name", "confidence", "text", "x1", "y1", "x2", "y2", "timestamp"]
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+    "arrow": "application/vnd.apache.arrow.stream",
+}
+
+
+def iter_row_batches(batch_size, **filters):
+    # StreamingResponse endpoint dondukten sonra tuketildigi icin oturum burada acilip kapanir
+    db = SessionLocal()
+    try:
+        columns = [getattr(Detection, field) for field in EXPORT_FIELDS]
+        query = filter_detections(db.query(*columns), **filters).order_by(Detection.id)
+        # yield_per sunucu tarafi cursor ile okur; bellekte en fazla bir parti tutulur
+        rows = iter(query.yield_per(batch_size))
+        while True:
+            batch = list(islice(rows, batch_size))
+            if not batch:
+                break
+            yield batch
+    finally:
+        db.close()
+
+
+def stream_ndjson(batches):
+    for batch in batches:
+        yield "".join(
+            json.dumps(dict(zip(EXPORT_FIELDS, row)), default=str, ensure_ascii=False) + "\n"
+            for row in batch
+        )
+
+
+def stream_csv(batches):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_FIELDS)
+    for batch in batches:
+        writer.writerows(batch)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def arrow_schema():
+    return pa.schema([
+        ("id", pa.int64()),
+        ("object_name", pa.string()),
+        ("confidence", pa.float64()),
+        ("text", pa.string()),
+        ("x1", pa.int32()),
+        ("y1", pa.int32()),
+        ("x2", pa.int32()),
+        ("y2", pa.int32()),
+        ("timestamp", pa.timestamp("us")),
+    ])
+
+
+def stream_arrow(batches):
+    schema = arrow_schema()
+    sink = io.BytesIO()
+    with pa.ipc.new_stream(sink, schema) as writer:
+        for batch in batches:
+            columns = list(zip(*batch))
+            writer.write_batch(pa.record_batch(
+                [pa.array(values, type=field.type) for values, field in zip(columns, schema)],
+                schema=schema,
+            ))
+            yield sink.getvalue()
+            sink.seek(0)
+            sink.truncate()
+    yield sink.getvalue()
+
+
+def export_detections(fmt, batch_size, **filters):
+    if fmt not in MEDIA_TYPES:
+        raise ValueError(f"Desteklenmeyen format: {fmt}")
+    if fmt == "arrow" and pa is None:
+        raise ValueError("Arrow çıktısı için pyarrow kurulu olmalı")
+    writer = {"ndjson": stream_ndjson, "csv": stream_csv, "arrow": stream_arrow}[fmt]
+    return writer(iter_row_batches(batch_size, **filters)), MEDIA_TYPES[fmt]
@@ -1,58 +1,232 @@
-from ultralytics import YOLO
-import easyocr
-import cv2
-import numpy as np
-from datetime import datetime
-from ..models.detection import SessionLocal
-from .db_manager import add_detection
-
-model = YOLO("yolov8n.pt")
-reader = easyocr.Reader(['en'])
-
-def process_image(image_bytes):
-    nparr = np.frombuffer(image_bytes, np.uint8)
-    img = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
-
-    results = model(img)
-    detections = []
-
-    for result in results:
-        for box in result.boxes:
-            x1, y1, x2, y2 = map(int, box.xyxy[0])
-            conf = float(box.conf[0])
-            cls = int(box.cls[0])
-            label = model.names[cls]
-
-            detection_data = {
-                "object_name": label,
-                "confidence": conf,
-                "x1": x1,
-                "y1": y1,
-                "x2": x2,
-                "y2": y2,
-                "timestamp": datetime.now()
-            }
-            detections.append(detection_data)
-
-    ocr_results = reader.readtext(img)
-    for (bbox, text, prob) in ocr_results:
-        (top_left, _, bottom_right, _) = bbox
-        top_left = tuple(map(int, top_left))
-        bottom_right = tuple(map(int, bottom_right))
-
-        detection_data = {
-            "text": text,
-            "x1": top_left[0],
-            "y1": top_left[1],
-            "x2": bottom_right[0],
-            "y2": bottom_right[1],
-            "timestamp": datetime.now()
-        }
-        detections.append(detection_data)
-
-    db = SessionLocal()
-    for detection in detections:
-        add_detection(db, detection)
-    db.close()
-
-    return detections
+import cv2
+import logging
+import time
+import numpy as np
+from datetime import datetime
+from .db_manager import SessionLocal, add_detections_bulk
+from .model_registry import get_model, get_reader
+from .ocr_gate import read_text_gated
+from .tiling import tile_windows, merge_boxes
+from .metrics import stage_timer
+from .cascade import needs_detector
+from ..config import (
+    OCR_MODE, OCR_GATE_SOURCE, OCR_TEXT_CLASSES, REDUCED_DECODE, DECODE_TARGET_SIZE,
+    TILED_INFERENCE, TILE_SIZE, TILE_OVERLAP, TILE_MERGE_THRESHOLD, TILE_INCLUDE_FULL_FRAME, CASCADE_MODE,
+)
+
+logger = logging.getLogger(__name__)
+
+_REDUCED_FLAGS = [
+    (8, cv2.IMREAD_REDUCED_COLOR_8),
+    (4, cv2.IMREAD_REDUCED_COLOR_4),
+    (2, cv2.IMREAD_REDUCED_COLOR_2),
+]
+# SOF isaretleri; C4 (DHT), C8 (JPG) ve CC (DAC) boyut tasimaz
+_JPEG_SOF_MARKERS = set(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+def jpeg_size(data):
+    """JPEG basligindan (genislik, yukseklik) okur; goruntu cozulmez. JPEG degilse None doner."""
+    if len(data) < 4 or data[0] != 0xFF or data[1] != 0xD8:
+        return None
+    i = 2
+    while i + 9 < len(data):
+        if data[i] != 0xFF:
+            return None
+        marker = data[i + 1]
+        if marker == 0xFF:
+            i += 1
+            continue
+        if marker == 0x01 or 0xD0 <= marker <= 0xD8:
+            i += 2
+            continue
+        if marker in _JPEG_SOF_MARKERS:
+            return (data[i + 7] << 8) | data[i + 8], (data[i + 5] << 8) | data[i + 6]
+        i += 2 + ((data[i + 2] << 8) | data[i + 3])
+    return None
+
+def decode_flag(image_bytes):
+    # libjpeg DCT olceklemesiyle dogrudan kucuk cozum; yalnizca JPEG icin hizlidir.
+    # Karolu modda kucuk nesneler icin tam cozunurluk gerekir
+    size = jpeg_size(image_bytes) if REDUCED_DECODE and not TILED_INFERENCE else None
+    if size:
+        for factor, flag in _REDUCED_FLAGS:
+            if max(size) // factor >= DECODE_TARGET_SIZE:
+                return flag, factor
+    return cv2.IMREAD_COLOR, 1
+
+def decode_image(image_bytes):
+    """Goruntuyu cozer ve (goruntu, olcek) dondurur; kutular olcekle carpilinca orijinal piksellere doner."""
+    if len(image_bytes) == 0:
+        raise ValueError("Boş görüntü")
+    flag, scale = decode_flag(image_bytes)
+    nparr = np.frombuffer(image_bytes, np.uint8)
+    try:
+        img = cv2.imdecode(nparr, flag)
+    except cv2.error as e:
+        # Bozuk girdi partideki diger goruntuleri dusurmesin diye ValueError'a cevrilir
+        raise ValueError(f"Görüntü çözümlenemedi: {e}") from e
+    if img is None:
+        raise ValueError("Görüntü çözümlenemedi")
+    return img, scale
+
+def scale_detections(detections, scale):
+    if scale != 1:
+        for detection in detections:
+            for key in ("x1", "y1", "x2", "y2"):
+                detection[key] *= scale
+    return detections
+
+def extract_objects(result, names=None):
+    # Sinif adlari sonucu ureten modelden alinmali; verilmezse paylasilan modelinkiler kullanilir
+    names = names if names is not None else get_model().names
+    detections = []
+    for box in result.boxes:
+        x1, y1, x2, y2 = map(int, box.xyxy[0])
+        conf = float(box.conf[0])
+        cls = int(box.cls[0])
+        label = names[cls]
+
+        detection_data = {
+            "object_name": label,
+            "confidence": conf,
+            "x1": x1,
+            "y1": y1,
+            "x2": x2,
+            "y2": y2,
+            "timestamp": datetime.now()
+        }
+        detections.append(detection_data)
+    return detections
+
+def detect_tiled(img):
+    """Ortusen karolari tek model cagrisinda isler, kutulari kareye tasiyip karolar arasi birlestirir.
+
+    (tespitler, karo_sayisi) dondurur. Karolar tek partide islendiginden karo basina sure
+    olculemez; cagiran toplam sureyi karo sayisiyla birlikte raporlar.
+    """
+    h, w = img.shape[:2]
+    windows = tile_windows(w, h, TILE_SIZE, TILE_OVERLAP)
+    crops = [img[y1:y2, x1:x2] for x1, y1, x2, y2 in windows]
+    if TILE_INCLUDE_FULL_FRAME and len(windows) > 1:
+        # Karolara sigmayan buyuk nesneler icin kucultulmus tam kare de ayni partiye eklenir
+        windows.append((0, 0, w, h))
+        crops.append(img)
+
+    started = time.perf_counter()
+    results = get_model()(crops, verbose=False)
+    total_ms = (time.perf_counter() - started) * 1000
+
+    detections = []
+    for (x1, y1, x2, y2), result in zip(windows, results):
+        objects = extract_objects(result)
+        for detection in objects:
+            detection["x1"] += x1
+            detection["y1"] += y1
+            detection["x2"] += x1
+            detection["y2"] += y1
+        detections.extend(objects)
+
+    merged = merge_boxes(detections, TILE_MERGE_THRESHOLD)
+    logger.info("%d karo, %d kutu -> %d kutu, %.1f ms", len(windows), len(detections), len(merged), total_ms)
+    return merged, len(windows)
+
+def run_ocr(img, objects):
+    if OCR_MODE == "gated":
+        return read_text_gated(get_reader(), img, objects, OCR_GATE_SOURCE, OCR_TEXT_CLASSES)
+    return get_reader().readtext(img)
+
+def extract_text(img, objects=()):
+    detections = []
+    ocr_results = run_ocr(img, objects)
+    for (bbox, text, prob) in ocr_results:
+        (top_left, _, bottom_right, _) = bbox
+        top_left = tuple(map(int, top_left))
+        bottom_right = tuple(map(int, bottom_right))
+
+        detection_data = {
+            "text": text,
+            "x1": top_left[0],
+            "y1": top_left[1],
+            "x2": bottom_right[0],
+            "y2": bottom_right[1],
+            "timestamp": datetime.now()
+        }
+        detections.append(detection_data)
+    return detections
+
+def save_detections(detections):
+    db = SessionLocal()
+    try:
+        add_detections_bulk(db, detections)
+    finally:
+        db.close()
+
+def process_images(images_bytes, persist=True, timings=None):
+    """Goruntuleri tek partide isler; her girdi icin tespit listesi ya da hata dondurur.
+
+    `timings` bir liste ise her goruntu icin asama surelerini (saniye) iceren sozlukler eklenir;
+    parti cikarim suresi goruntulere esit paylastirilir. Kaskadin atladigi goruntulerde
+    "cascade" suresi olup "inference" suresi olmaz. Karolu cikarimda "inference" goruntunun
+    tum karolarinin toplam suresidir ve "tiles" karo sayisini (sure degil) tasir.
+    """
+    # Gecersiz goruntuler tum partiyi dusurmesin diye hata kendi sirasinda doner
+    batch = [None] * len(images_bytes)
+    image_timings = [{} for _ in images_bytes]
+    imgs = []
+    scales = []
+    positions = []
+    for i, image_bytes in enumerate(images_bytes):
+        try:
+            with stage_timer(image_timings[i], "decode"):
+                img, scale = decode_image(image_bytes)
+        except ValueError as e:
+            batch[i] = e
+            continue
+        if CASCADE_MODE != "off":
+            with stage_timer(image_timings[i], "cascade"):
+                skip = not needs_detector(img)
+            if skip:
+                batch[i] = []
+                continue
+        imgs.append(img)
+        scales.append(scale)
+        positions.append(i)
+
+    if timings is not None:
+        timings.extend(image_timings)
+    if not imgs:
+        return batch
+
+    if TILED_INFERENCE:
+        # Her goruntunun karolari kendi model cagrisinda toplu islenir
+        for i, img in zip(positions, imgs):
+            with stage_timer(image_timings[i], "inference"):
+                objects, image_timings[i]["tiles"] = detect_tiled(img)
+            with stage_timer(image_timings[i], "ocr"):
+                batch[i] = objects + extract_text(img, objects)
+    else:
+        shared = {}
+        with stage_timer(shared, "inference"):
+            results = get_model()(imgs)
+        for i, img, scale, result in zip(positions, imgs, scales, results):
+            image_timings[i]["inference"] = shared["inference"] / len(imgs)
+            objects = extract_objects(result)
+            with stage_timer(image_timings[i], "ocr"):
+                batch[i] = scale_detections(objects + extract_text(img, objects), scale)
+
+    if persist:
+        # Partideki tum goruntulerin tespitleri tek transaction ile yazilir
+        save_detections([d for i in positions for d in batch[i]])
+    return batch
+
+def process_images_timed(images_bytes):
+    # Batcher icin: sonuclar (tespitler, asama_sureleri) ciftidir; surec havuzunda da sureler ana surece tasinir
+    timings = []
+    results = process_images(images_bytes, persist=False, timings=timings)
+    return [r if isinstance(r, Exception) else (r, t) for r, t in zip(results, timings)]
+
+def process_image(image_bytes):
+    detections = process_images([image_bytes])[0]
+    if isinstance(detections, Exception):
+        raise detections
+    return detections
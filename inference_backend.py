@@ -0,0 +1,48 @@
+import os
+
+# ultralytics.YOLO disa aktarilmis modelleri ayni Results arayuzuyle yukler;
+# boylece process_image hangi arka uc kullanilirsa kullanilsin degismez
+BACKEND_SUFFIXES = [
+    ("_openvino_model", "openvino"),
+    (".onnx", "onnx"),
+    (".engine", "tensorrt"),
+    (".torchscript", "torchscript"),
+    (".pt", "pytorch"),
+]
+
+
+def backend_name(model_path):
+    path = model_path.rstrip("/\\")
+    for suffix, name in BACKEND_SUFFIXES:
+        if path.endswith(suffix):
+            return name
+    raise ValueError(f"Model arka ucu tanınamadı: {model_path}")
+
+
+def load_detector(model_path):
+    backend_name(model_path)
+    from ultralytics import YOLO
+    return YOLO(model_path, task="detect")
+
+
+def export_model(source, fmt="onnx", int8=False, imgsz=640):
+    """PyTorch modelini ONNX veya OpenVINO'ya aktarir ve olusan yolu dondurur.
+
+    OpenVINO INT8 icin ultralytics'in NNCF kalibrasyonu, ONNX INT8 icin
+    onnxruntime'in dinamik nicemlemesi kullanilir. Toplu cagrilar icin girdi boyutlari dinamiktir.
+    """
+    if fmt not in ("onnx", "openvino"):
+        raise ValueError(f"Desteklenmeyen format: {fmt}")
+    from ultralytics import YOLO
+    model = YOLO(source)
+    if fmt == "openvino":
+        return model.export(format="openvino", imgsz=imgsz, int8=int8, dynamic=True)
+
+    path = model.export(format="onnx", imgsz=imgsz, dynamic=True)
+    if not int8:
+        return path
+    from onnxruntime.quantization import quantize_dynamic, QuantType
+    base, ext = os.path.splitext(path)
+    int8_path = f"{base}_int8{ext}"
+    quantize_dynamic(path, int8_path, weight_type=QuantType.QUInt8)
+    return int8_path
@@ -0,0 +1,123 @@
+import asyncio
+
+
+class QueueFullError(Exception):
+    pass
+
+
+class InferenceBatcher:
+    """Eszamanli istekleri kisa bir pencerede toplayip tek bir toplu cagriya donusturur.
+
+    `handler` bir girdi listesi alip ayni sirada sonuc listesi dondurmelidir.
+    Listedeki bir sonuc Exception ise yalnizca o istege hata olarak iletilir.
+    Bekleyen istek sayisi `max_pending` degerine ulasinca `submit` QueueFullError firlatir.
+    `on_batch` verilirse her parti sonrasi parti boyutu ve suresiyle (saniye) cagrilir.
+    """
+
+    def __init__(self, handler, max_batch_size=8, max_wait_ms=5, executor=None,
+                 max_concurrency=1, max_pending=None, on_batch=None):
+        self.handler = handler
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self.executor = executor
+        self.max_concurrency = max_concurrency
+        self.max_pending = max_pending
+        self.on_batch = on_batch
+        self.pending = 0
+        self._queue = None
+        self._worker = None
+        self._slots = None
+        self._tasks = set()
+
+    async def start(self):
+        if self._worker is None:
+            self._queue = asyncio.Queue()
+            self._slots = asyncio.Semaphore(self.max_concurrency)
+            self._worker = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._worker is None:
+            return
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        self._worker = None
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        while not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            if not future.done():
+                future.set_exception(RuntimeError("Batcher durduruldu"))
+
+    def qsize(self):
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def submit(self, item):
+        await self.start()
+        if self.max_pending is not None and self.pending >= self.max_pending:
+            raise QueueFullError("Çıkarım kuyruğu dolu")
+        self.pending += 1
+        try:
+            future = asyncio.get_running_loop().create_future()
+            await self._queue.put((item, future))
+            return await future
+        finally:
+            self.pending -= 1
+
+    async def _collect(self):
+        loop = asyncio.get_running_loop()
+        batch = [await self._queue.get()]
+        deadline = loop.time() + self.max_wait_ms / 1000
+        try:
+            while len(batch) < self.max_batch_size:
+                # Model mesgulken biriken istekler beklemeden partiye alinir
+                if not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+                    continue
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+        except asyncio.CancelledError:
+            # Durdurulurken kuyruktan alinmis istekler askida kalmaz
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(RuntimeError("Batcher durduruldu"))
+            raise
+        return [(item, future) for item, future in batch if not future.cancelled()]
+
+    async def _run(self):
+        while True:
+            await self._slots.acquire()
+            batch = await self._collect()
+            if not batch:
+                self._slots.release()
+                continue
+            task = asyncio.create_task(self._dispatch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self, batch):
+        loop = asyncio.get_running_loop()
+        items = [item for item, _ in batch]
+        started = loop.time()
+        try:
+            results = await loop.run_in_executor(self.executor, self.handler, items)
+        except Exception as e:
+            results = [e] * len(batch)
+        finally:
+            self._slots.release()
+        if self.on_batch is not None:
+            self.on_batch(len(batch), loop.time() - started)
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
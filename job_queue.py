@@ -0,0 +1,232 @@
+import json
+import logging
+import multiprocessing
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from datetime import datetime
+from ..config import JOB_DB_PATH, JOB_DIR, JOB_POLL_INTERVAL, JOB_STALE_SECONDS, JOB_HEARTBEAT_INTERVAL
+
+logger = logging.getLogger(__name__)
+
+FINISHED = ("done", "failed")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    payload_path TEXT NOT NULL,
+    status TEXT NOT NULL,
+    result TEXT,
+    error TEXT,
+    worker TEXT,
+    created_at REAL NOT NULL,
+    started_at REAL,
+    heartbeat_at REAL,
+    finished_at REAL
+);
+CREATE INDEX IF NOT EXISTS ix_jobs_status_created ON jobs (status, created_at);
+"""
+
+
+def new_job_id():
+    return uuid.uuid4().hex
+
+
+def _json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"JSON'a çevrilemeyen değer: {type(value).__name__}")
+
+
+class JobQueue:
+    """SQLite tablosu uzerinde kalici is kuyrugu; API sureci ekler, isci surecleri sahiplenir.
+
+    Isler queued -> running -> done/failed durumlarindan gecer. Sahiplenme BEGIN IMMEDIATE
+    ile yapildigindan ayni is iki isciye verilmez. Calisan isci `heartbeat` ile kirasini
+    yeniler; kirasi JOB_STALE_SECONDS boyunca yenilenmeyen (cokmus iscinin) isler
+    `requeue_stale` ile yeniden kuyruga alinir. Sonuc yalnizca isin guncel sahibi
+    tarafindan yazilabilir.
+    """
+
+    def __init__(self, path=JOB_DB_PATH):
+        self.path = path
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    def _connect(self):
+        # Her cagri kendi baglantisini acar; baglanti thread ve surecler arasinda paylasilmaz
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return _Closing(conn)
+
+    def submit(self, kind, payload_path, job_id=None):
+        job_id = job_id or new_job_id()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO jobs (id, kind, payload_path, status, created_at) VALUES (?, ?, ?, 'queued', ?)",
+                (job_id, kind, payload_path, time.time()),
+            )
+        return job_id
+
+    def claim(self, worker):
+        """En eski bekleyen isi bu isciye atar ve dondurur; is yoksa None."""
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                "SELECT * FROM jobs WHERE status = 'queued' ORDER BY created_at LIMIT 1"
+            ).fetchone()
+            if row is None:
+                conn.execute("COMMIT")
+                return None
+            now = time.time()
+            conn.execute(
+                "UPDATE jobs SET status = 'running', worker = ?, started_at = ?, heartbeat_at = ? WHERE id = ?",
+                (worker, now, now, row["id"]),
+            )
+            conn.execute("COMMIT")
+        return dict(row, status="running", worker=worker)
+
+    def heartbeat(self, job_id, worker):
+        """Isin kirasini yeniler; is artik bu iscinin degilse False dondurur."""
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET heartbeat_at = ? WHERE id = ? AND worker = ? AND status = 'running'",
+                (time.time(), job_id, worker),
+            )
+        return cursor.rowcount == 1
+
+    def complete(self, job_id, worker, result):
+        return self._finish(job_id, worker, "done", result=json.dumps(result, default=_json_default))
+
+    def fail(self, job_id, worker, error):
+        return self._finish(job_id, worker, "failed", error=error)
+
+    def _finish(self, job_id, worker, status, result=None, error=None):
+        # Kuyruga geri alinip baska isciye verilmis isin sonucu eski isci tarafindan ezilmez
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET status = ?, result = ?, error = ?, finished_at = ? "
+                "WHERE id = ? AND worker = ? AND status = 'running'",
+                (status, result, error, time.time(), job_id, worker),
+            )
+        return cursor.rowcount == 1
+
+    def get(self, job_id):
+        with self._connect() as conn:
+            row = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        if row is None:
+            return None
+        job = dict(row)
+        job["result"] = json.loads(job["result"]) if job["result"] else None
+        return job
+
+    def requeue_stale(self, max_seconds=JOB_STALE_SECONDS):
+        """Kirasi `max_seconds` boyunca yenilenmemis isleri yeniden kuyruga alir; is sayisini dondurur."""
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET status = 'queued', worker = NULL, started_at = NULL, heartbeat_at = NULL "
+                "WHERE status = 'running' AND COALESCE(heartbeat_at, started_at) < ?",
+                (time.time() - max_seconds,),
+            )
+        return cursor.rowcount
+
+    def counts(self):
+        with self._connect() as conn:
+            rows = conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall()
+        return {status: count for status, count in rows}
+
+
+class _Closing:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None and self.conn.in_transaction:
+            self.conn.execute("ROLLBACK")
+        self.conn.close()
+
+
+def job_payload_path(job_id, suffix):
+    os.makedirs(JOB_DIR, exist_ok=True)
+    return os.path.join(JOB_DIR, job_id + suffix)
+
+
+def run_job(job):
+    # Agir bagimliliklar yalnizca isci surecinde yuklenir
+    from .image_processor import process_image
+    from .video_processor import process_video
+
+    if job["kind"] == "image":
+        with open(job["payload_path"], "rb") as f:
+            return {"detections": process_image(f.read())}
+    if job["kind"] == "video":
+        return process_video(job["payload_path"])
+    raise ValueError(f"Bilinmeyen iş türü: {job['kind']}")
+
+
+def _keep_alive(queue, job_id, worker, done, interval):
+    while not done.wait(interval):
+        if not queue.heartbeat(job_id, worker):
+            logger.warning("İş %s artık bu işçiye ait değil", job_id)
+            return
+
+
+def worker_loop(queue_path=JOB_DB_PATH, stop_event=None, poll_interval=JOB_POLL_INTERVAL,
+                heartbeat_interval=JOB_HEARTBEAT_INTERVAL):
+    queue = JobQueue(queue_path)
+    worker = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+    last_requeue = 0.0
+    while stop_event is None or not stop_event.is_set():
+        if time.monotonic() - last_requeue >= heartbeat_interval:
+            # API yeniden baslamasa da coken iscilerin isleri bosta kalan iscilerce devralinir
+            queue.requeue_stale()
+            last_requeue = time.monotonic()
+        job = queue.claim(worker)
+        if job is None:
+            time.sleep(poll_interval)
+            continue
+        # Uzun videolarda is surerken kira arka planda yenilenir
+        done = threading.Event()
+        threading.Thread(
+            target=_keep_alive, args=(queue, job["id"], worker, done, heartbeat_interval), daemon=True,
+        ).start()
+        try:
+            owned = queue.complete(job["id"], worker, run_job(job))
+        except Exception as e:
+            logger.exception("İş %s başarısız", job["id"])
+            owned = queue.fail(job["id"], worker, str(e))
+        finally:
+            done.set()
+        # Is baska isciye gectiyse girdi dosyasi onun icin birakilir
+        if owned and os.path.exists(job["payload_path"]):
+            os.remove(job["payload_path"])
+
+
+def start_workers(count, queue_path=JOB_DB_PATH):
+    """Is kuyrugunu isleyen `count` surec baslatir; (surecler, durdurma_olayi) dondurur."""
+    # spawn: API surecinin thread'leri ve olay dongusu cocuklara kopyalanmaz
+    context = multiprocessing.get_context("spawn")
+    stop_event = context.Event()
+    workers = [
+        context.Process(target=worker_loop, args=(queue_path, stop_event), name=f"job-worker-{i}", daemon=True)
+        for i in range(count)
+    ]
+    for process in workers:
+        process.start()
+    return workers, stop_event
+
+
+def stop_workers(workers, stop_event, timeout=10):
+    stop_event.set()
+    for process in workers:
+        process.join(timeout)
+        if process.is_alive():
+            process.terminate()
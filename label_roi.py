@@ -0,0 +1,91 @@
+"""
+Kargo etiketi bolgesini bulup OCR'e hazirlayan ortak asama.
+
+Tesseract suresi piksel sayisiyla buyudugu icin tum kare yerine yalnizca etiket
+bolgesi gonderilir: parlak dortgen etiket bulunur, perspektifi duzeltilerek kirpilir
+ve uyarlamali esikleme ile ikili goruntuye cevrilir. Etiket bulunamazsa tum kare
+ayni on islemden gecirilir.
+"""
+
+import cv2
+import numpy as np
+
+TESPIT_GENISLIGI = 640  # etiket arama bu genislige kucultulmus karede yapilir
+MIN_ALAN_ORANI = 0.02  # karenin bu oranindan kucuk dortgenler etiket sayilmaz
+MAX_ALAN_ORANI = 0.95
+HEDEF_YUKSEKLIK = 600  # kucuk etiket kirpintilari Tesseract icin bu yukseklige (en fazla 2 kat) buyutulur
+ESIK_BLOK_BOYUTU = 31
+ESIK_SABITI = 15
+
+def koseleri_sirala(noktalar):
+    """Dort noktayi sol-ust, sag-ust, sag-alt, sol-alt sirasina koyar."""
+    noktalar = np.asarray(noktalar, dtype=np.float32).reshape(4, 2)
+    toplam = noktalar.sum(axis=1)
+    fark = np.diff(noktalar, axis=1).ravel()
+    return np.array([
+        noktalar[np.argmin(toplam)],
+        noktalar[np.argmin(fark)],
+        noktalar[np.argmax(toplam)],
+        noktalar[np.argmax(fark)],
+    ], dtype=np.float32)
+
+def etiket_bul(kare):
+    """
+    Karedeki en buyuk parlak dortgeni (etiket) arar.
+    Koseleri orijinal kare koordinatlarinda dondurur; bulunamazsa None.
+    """
+    yukseklik, genislik = kare.shape[:2]
+    olcek = min(1.0, TESPIT_GENISLIGI / genislik)
+    kucuk = cv2.resize(kare, (int(genislik * olcek), int(yukseklik * olcek)), interpolation=cv2.INTER_AREA)
+    gri = cv2.cvtColor(kucuk, cv2.COLOR_BGR2GRAY) if kucuk.ndim == 3 else kucuk
+    gri = cv2.GaussianBlur(gri, (5, 5), 0)
+    _, maske = cv2.threshold(gri, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+    # Etiket uzerindeki koyu yazilar maskede delik birakmasin
+    maske = cv2.morphologyEx(maske, cv2.MORPH_CLOSE, cv2.getStructuringElement(cv2.MORPH_RECT, (15, 15)))
+
+    konturlar, _ = cv2.findContours(maske, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+    alan = gri.shape[0] * gri.shape[1]
+    for kontur in sorted(konturlar, key=cv2.contourArea, reverse=True):
+        oran = cv2.contourArea(kontur) / alan
+        if oran < MIN_ALAN_ORANI:
+            break
+        if oran > MAX_ALAN_ORANI:
+            continue
+        cevre = cv2.arcLength(kontur, True)
+        yaklasik = cv2.approxPolyDP(kontur, 0.02 * cevre, True)
+        if len(yaklasik) == 4 and cv2.isContourConvex(yaklasik):
+            koseler = yaklasik
+        else:
+            # Kosesi kapanmis ya da kivrilmis etiketler icin en kucuk donuk dikdortgen
+            koseler = cv2.boxPoints(cv2.minAreaRect(kontur))
+        return koseleri_sirala(koseler) / olcek
+    return None
+
+def etiket_kirp(kare, koseler):
+    """Etiketi perspektifi ve egikligi duzeltilmis dikdortgen olarak kirpar."""
+    sol_ust, sag_ust, sag_alt, sol_alt = koseler
+    genislik = int(max(np.linalg.norm(sag_ust - sol_ust), np.linalg.norm(sag_alt - sol_alt)))
+    yukseklik = int(max(np.linalg.norm(sol_alt - sol_ust), np.linalg.norm(sag_alt - sag_ust)))
+    hedef = np.array([[0, 0], [genislik - 1, 0], [genislik - 1, yukseklik - 1], [0, yukseklik - 1]], dtype=np.float32)
+    donusum = cv2.getPerspectiveTransform(koseler, hedef)
+    return cv2.warpPerspective(kare, donusum, (genislik, yukseklik))
+
+def ikili_goruntu(goruntu, min_yukseklik=0):
+    """Gri tonlamaya cevirir, gerekirse buyutur ve uyarlamali esikler (golge ve parlamaya dayanikli)."""
+    gri = cv2.cvtColor(goruntu, cv2.COLOR_BGR2GRAY) if goruntu.ndim == 3 else goruntu
+    if gri.shape[0] < min_yukseklik:
+        olcek = min(2.0, min_yukseklik / gri.shape[0])
+        gri = cv2.resize(gri, None, fx=olcek, fy=olcek, interpolation=cv2.INTER_CUBIC)
+    return cv2.adaptiveThreshold(
+        gri, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, ESIK_BLOK_BOYUTU, ESIK_SABITI,
+    )
+
+def etiket_hazirla(kare):
+    """
+    Kareyi OCR'e hazirlar: etiket bulunursa kirpilip duzeltilir, sonra ikili goruntuye cevrilir.
+    (ikili_goruntu, koseler) dondurur; etiket bulunamazsa koseler None olur.
+    """
+    koseler = etiket_bul(kare)
+    if koseler is None:
+        return ikili_goruntu(kare), None
+    return ikili_goruntu(etiket_kirp(kare, koseler), HEDEF_YUKSEKLIK), koseler
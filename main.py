@@ -1,27 +1,394 @@
-from fastapi import FastAPI, UploadFile, File, HTTPException, Depends
-from .models.detection import Base, engine
-from .utils.image_processor import process_image
-from .utils.db_manager import get_db, init_db, get_all_detections
-from sqlalchemy.orm import Session
-
-init_db()
-
-app = FastAPI(
-    title="DroneVisionAI API",
-    description="İHA'lar için görüntü işleme ve nesne tanıma API'si",
-    version="0.1.0"
-)
-
-@app.post("/upload/")
-async def upload_image(file: UploadFile = File(...)):
-    try:
-        contents = await file.read()
-        detections = process_image(contents)
-        return {"status": "success", "detections": detections}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
-
-@app.get("/detections/")
-async def read_detections(db: Session = Depends(get_db)):
-    detections = get_all_detections(db)
-    return {"detections": detections}
+import asyncio
+import functools
+import os
+import tempfile
+from datetime import datetime
+from typing import List, Optional
+from fastapi import FastAPI, UploadFile, File, HTTPException, Depends, Query, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, StreamingResponse, PlainTextResponse
+from .models.detection import Base, engine
+from .utils.image_processor import process_images_timed
+from .utils.video_processor import process_video
+from .utils.inference_batcher import InferenceBatcher, QueueFullError
+from .utils.worker_pool import create_executor
+from .utils.exporter import export_detections
+from .utils.result_cache import ResultCache
+from .utils.upload_reader import BufferPool, read_upload, save_upload
+from .utils.batch_upload import is_image_name, iter_archive, read_limited, take
+from .utils.job_queue import FINISHED, JobQueue, job_payload_path, new_job_id, start_workers, stop_workers
+from .utils.model_registry import registry
+from .utils import metrics
+from .utils.metrics import Counter, Gauge, Histogram, stage_timer, server_timing_header
+from .utils.db_manager import init_db, detection_to_dict
+from .utils.async_db import get_async_db, get_detections_async, save_detections_async, async_engine
+from .config import (
+    BATCH_MAX_SIZE, BATCH_MAX_WAIT_MS, BATCH_UPLOAD_MAX_IMAGES,
+    EXECUTOR_KIND, EXECUTOR_WORKERS, MAX_PENDING_REQUESTS,
+    EXPORT_BATCH_SIZE, MODEL_PATH, ALLOWED_LANGUAGES, OCR_MODE, OCR_GATE_SOURCE,
+    CACHE_VERSION, CACHE_MAX_ENTRIES, CACHE_DIR, CACHE_TTL_SECONDS, CACHE_MAX_BYTES,
+    UPLOAD_CHUNK_SIZE, UPLOAD_BUFFER_POOL_SIZE, UPLOAD_BUFFER_MAX_BYTES, REDUCED_DECODE, DECODE_TARGET_SIZE,
+    TILED_INFERENCE, TILE_SIZE, TILE_OVERLAP, SERVER_TIMING,
+    JOB_WORKERS, JOB_POLL_INTERVAL, JOB_WAIT_MAX_SECONDS,
+    VIDEO_WORKERS, VIDEO_MAX_PENDING, VIDEO_MAX_UPLOAD_BYTES,
+    CASCADE_MODE, CASCADE_SIZE, CASCADE_EDGE_THRESHOLD,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+
+init_db()
+
+app = FastAPI(
+    title="DroneVisionAI API",
+    description="İHA'lar için görüntü işleme ve nesne tanıma API'si",
+    version="0.1.0"
+)
+
+STAGE_SECONDS = Histogram("dronevision_stage_seconds", "Görüntü başına aşama süresi", ("stage",))
+BATCH_SIZE = Histogram("dronevision_batch_size", "Çıkarım partisi boyutu", buckets=(1, 2, 4, 8, 16, 32, 64))
+BATCH_SECONDS = Histogram("dronevision_batch_seconds", "Parti başına toplam işleme süresi")
+
+TILED_INFERENCE_SECONDS = Histogram(
+    "dronevision_tiled_inference_seconds", "Karolu çıkarımda görüntü başına toplam süre (karo sayısına göre)", ("tiles",),
+)
+
+def observe_batch(size, seconds):
+    BATCH_SIZE.observe(size)
+    BATCH_SECONDS.observe(seconds)
+
+CASCADE_FRAMES = Counter(
+    "dronevision_cascade_frames_total", "Kaskad aşamalarına göre kare sayısı "
+    "(diff_skipped: video kare farkı, edges_skipped: kenar yoğunluğu, detector: tam dedektör)", ("stage",),
+)
+
+def observe_stages(timings):
+    for stage, seconds in timings.items():
+        if stage != "tiles":
+            STAGE_SECONDS.observe(seconds, stage)
+    if "tiles" in timings:
+        TILED_INFERENCE_SECONDS.observe(timings["inference"], str(timings["tiles"]))
+    if "cascade" in timings:
+        CASCADE_FRAMES.inc("detector" if "inference" in timings else "edges_skipped")
+
+def observe_video(stats):
+    CASCADE_FRAMES.inc("diff_skipped", amount=stats["frames_skipped"])
+    CASCADE_FRAMES.inc("edges_skipped", amount=stats["frames_gated"])
+    CASCADE_FRAMES.inc("detector", amount=stats["frames_processed"])
+
+executor = create_executor(EXECUTOR_KIND, EXECUTOR_WORKERS)
+# Uzun videolar cikarim iscilerini dakikalarca tutmasin diye ayri havuzda islenir
+video_executor = create_executor(EXECUTOR_KIND, VIDEO_WORKERS)
+video_pending = 0
+# Tespitler isci thread'inde degil, async oturumla olay dongusunu bloklamadan yazilir
+batcher = InferenceBatcher(
+    process_images_timed,
+    max_batch_size=BATCH_MAX_SIZE,
+    max_wait_ms=BATCH_MAX_WAIT_MS,
+    executor=executor,
+    max_concurrency=EXECUTOR_WORKERS,
+    max_pending=MAX_PENDING_REQUESTS,
+    on_batch=observe_batch,
+)
+
+# Sonuclari degistiren her ayar onbellek anahtarina katilir
+cache_namespace = "|".join(map(str, (
+    MODEL_PATH, ALLOWED_LANGUAGES, OCR_MODE, OCR_GATE_SOURCE, REDUCED_DECODE, DECODE_TARGET_SIZE,
+    TILED_INFERENCE, TILE_SIZE, TILE_OVERLAP, CASCADE_MODE, CASCADE_SIZE, CASCADE_EDGE_THRESHOLD, CACHE_VERSION,
+)))
+result_cache = ResultCache(
+    max_entries=CACHE_MAX_ENTRIES,
+    disk_dir=CACHE_DIR,
+    disk_ttl_seconds=CACHE_TTL_SECONDS,
+    disk_max_bytes=CACHE_MAX_BYTES,
+    namespace=cache_namespace,
+)
+
+async def cache_get(key):
+    # Disk katmani varsa dosya okuma, yazma ve tahliye olay dongusunu bloklamasin
+    if result_cache.disk_dir:
+        return await run_in_threadpool(result_cache.get, key)
+    return result_cache.get(key)
+
+async def cache_put(key, detections):
+    if result_cache.disk_dir:
+        await run_in_threadpool(result_cache.put, key, detections)
+    else:
+        result_cache.put(key, detections)
+
+upload_buffers = BufferPool(max_buffers=UPLOAD_BUFFER_POOL_SIZE, max_buffer_size=UPLOAD_BUFFER_MAX_BYTES)
+
+job_queue = JobQueue()
+
+Gauge("dronevision_queue_depth", "Kuyrukta ve işlemde bekleyen yükleme sayısı", fn=lambda: batcher.pending)
+Counter("dronevision_cache_hits_total", "Sonuç önbelleği isabetleri", fn=lambda: result_cache.hits)
+Counter("dronevision_cache_misses_total", "Sonuç önbelleği ıskaları", fn=lambda: result_cache.misses)
+Gauge("dronevision_cache_hit_ratio", "Sonuç önbelleği isabet oranı", fn=lambda: result_cache.stats()["hit_ratio"])
+Gauge("dronevision_video_pending", "İşlenen ve bekleyen video sayısı", fn=lambda: video_pending)
+# SQLite sorgusu olay dongusunu bloklamasin diye /metrics okunurken thread'de guncellenir
+JOBS_QUEUED = Gauge("dronevision_jobs_queued", "İş kuyruğunda bekleyen iş sayısı")
+Gauge("dronevision_model_load_seconds", "Model yükleme ve ısınma süresi", fn=lambda: registry.load_seconds)
+
+@app.on_event("startup")
+async def start_batcher():
+    await batcher.start()
+    # Modeller arka planda yuklenir; sunucu hemen ayaga kalkar, hazir olunca /healthz/ready 200 doner
+    loop = asyncio.get_running_loop()
+    # Her cikarim iscisi kendi kopyasini hazir olmadan once yukler
+    pools = [(executor, EXECUTOR_WORKERS), (video_executor, VIDEO_WORKERS)]
+    app.state.warm_up = loop.run_in_executor(None, functools.partial(registry.warm_up, pools))
+    # Coken iscilerden kalan isler yeniden kuyruga alinir
+    job_queue.requeue_stale()
+    app.state.job_workers = start_workers(JOB_WORKERS) if JOB_WORKERS else None
+
+@app.on_event("shutdown")
+async def stop_batcher():
+    await batcher.stop()
+    executor.shutdown(wait=False)
+    video_executor.shutdown(wait=False)
+    await async_engine.dispose()
+    if app.state.job_workers:
+        await run_in_threadpool(stop_workers, *app.state.job_workers)
+
+@app.post("/upload/")
+async def upload_image(response: Response, file: UploadFile = File(...)):
+    if not registry.ready:
+        raise HTTPException(status_code=503, detail="Modeller henüz hazır değil", headers={"Retry-After": "5"})
+    buffer = None
+    try:
+        buffer, contents = await read_upload(file, upload_buffers)
+        # Baglanti kopmasi sonrasi tekrar gonderilen kareler yeniden islenmez
+        cache_key = result_cache.key(contents)
+        detections = await cache_get(cache_key)
+        if detections is not None:
+            return {"status": "success", "detections": detections, "cached": True}
+        # Surec havuzuna memoryview tasinamaz; thread havuzunda tampon kopyalanmadan cozulur
+        item = bytes(contents) if EXECUTOR_KIND == "process" else contents
+        detections, timings = await batcher.submit(item)
+        with stage_timer(timings, "persistence"):
+            await save_detections_async(detections)
+        observe_stages(timings)
+        if SERVER_TIMING:
+            response.headers["Server-Timing"] = server_timing_header(timings)
+        await cache_put(cache_key, detections)
+        return {"status": "success", "detections": detections, "cached": False}
+    except asyncio.CancelledError:
+        # Isci tamponu hala okuyor olabilir; havuza geri verilmez
+        buffer = None
+        raise
+    except QueueFullError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    finally:
+        if buffer is not None:
+            upload_buffers.release(buffer)
+
+@app.post("/upload/batch/")
+async def upload_batch(files: List[UploadFile] = File(...)):
+    """Birden cok goruntuyu ya da zip/tar arsivini tek istekte isler; sonuclar goruntu basina doner."""
+    if not registry.ready:
+        raise HTTPException(status_code=503, detail="Modeller henüz hazır değil", headers={"Retry-After": "5"})
+    loop = asyncio.get_running_loop()
+    results = []
+    detections = []
+    pending = []
+
+    async def flush():
+        # Goruntuler tek istekler gibi batcher'dan gecer; eszamanlilik ve kuyruk siniri ortak uygulanir
+        outputs = await asyncio.gather(*(batcher.submit(data) for _, _, data in pending), return_exceptions=True)
+        for output in outputs:
+            if isinstance(output, QueueFullError):
+                raise output
+        for (result, cache_key, _), output in zip(pending, outputs):
+            if isinstance(output, Exception):
+                result.update(status="error", error=str(output))
+                continue
+            image_detections, timings = output
+            observe_stages(timings)
+            result.update(status="success", detections=image_detections, cached=False)
+            detections.extend(image_detections)
+            await cache_put(cache_key, image_detections)
+        pending.clear()
+
+    async def add(name, data):
+        if len(results) >= BATCH_UPLOAD_MAX_IMAGES:
+            raise HTTPException(status_code=413, detail=f"En fazla {BATCH_UPLOAD_MAX_IMAGES} görüntü yüklenebilir")
+        result = {"name": name}
+        results.append(result)
+        if isinstance(data, Exception):
+            result.update(status="error", error=str(data))
+            return
+        cache_key = result_cache.key(data)
+        cached = await cache_get(cache_key)
+        if cached is not None:
+            result.update(status="success", detections=cached, cached=True)
+            return
+        pending.append((result, cache_key, data))
+        if len(pending) >= BATCH_MAX_SIZE:
+            await flush()
+
+    try:
+        for file in files:
+            if is_image_name(file.filename) or (file.content_type or "").startswith("image/"):
+                await file.seek(0)
+                await add(file.filename, await loop.run_in_executor(None, read_limited, file.file, file.filename))
+                continue
+            # Arsiv uyeleri yukleme dosyasindan parti parti okunur; tamami bellege alinmaz
+            members = iter_archive(file.file)
+            try:
+                while chunk := await loop.run_in_executor(None, take, members, BATCH_MAX_SIZE):
+                    for name, data in chunk:
+                        await add(name, data)
+            finally:
+                members.close()
+        if pending:
+            await flush()
+        # Tum goruntulerin tespitleri tek transaction ile yazilir
+        timings = {}
+        with stage_timer(timings, "persistence"):
+            await save_detections_async(detections)
+        observe_stages(timings)
+    except HTTPException:
+        raise
+    except QueueFullError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    failed = sum(result["status"] != "success" for result in results)
+    return {"status": "success", "count": len(results), "failed": failed, "results": results}
+
+@app.post("/upload/video/")
+async def upload_video(file: UploadFile = File(...)):
+    global video_pending
+    if not registry.ready:
+        raise HTTPException(status_code=503, detail="Modeller henüz hazır değil", headers={"Retry-After": "5"})
+    if file.size is not None and file.size > VIDEO_MAX_UPLOAD_BYTES:
+        raise HTTPException(status_code=413, detail="Video boyut sınırı aşıldı")
+    if video_pending >= VIDEO_MAX_PENDING:
+        raise HTTPException(status_code=503, detail="Video kuyruğu dolu", headers={"Retry-After": "30"})
+    video_pending += 1
+    loop = asyncio.get_running_loop()
+    # OpenCV dosya yolundan okudugu icin yukleme gecici dosyaya yazilir
+    suffix = os.path.splitext(file.filename or "")[1] or ".mp4"
+    fd, video_path = tempfile.mkstemp(suffix=suffix)
+    os.close(fd)
+
+    def release():
+        global video_pending
+        video_pending -= 1
+        os.remove(video_path)
+
+    job = None
+    try:
+        if not await save_upload(file, video_path, VIDEO_MAX_UPLOAD_BYTES, UPLOAD_CHUNK_SIZE):
+            raise HTTPException(status_code=413, detail="Video boyut sınırı aşıldı")
+        job = video_executor.submit(functools.partial(process_video, video_path, persist=False))
+        # Istemci koparsa da video islenirken kuyruk yeri ve dosya birakilmaz; is bitince serbest kalir
+        job.add_done_callback(lambda _: loop.call_soon_threadsafe(release))
+        result = await asyncio.wrap_future(job)
+        timings = {}
+        with stage_timer(timings, "persistence"):
+            await save_detections_async(result["detections"])
+        observe_stages(timings)
+        observe_video(result["stats"])
+        return {"status": "success", **result}
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    finally:
+        if job is None:
+            release()
+
+@app.post("/jobs/", status_code=202)
+async def submit_job(file: UploadFile = File(...)):
+    """Yuklemeyi kalici kuyruga alir ve hemen is kimligi dondurur; isleme isci sureclerinde yapilir."""
+    kind = "image" if is_image_name(file.filename) or (file.content_type or "").startswith("image/") else "video"
+    suffix = os.path.splitext(file.filename or "")[1] or (".jpg" if kind == "image" else ".mp4")
+    job_id = new_job_id()
+    payload_path = job_payload_path(job_id, suffix)
+    try:
+        if not await save_upload(file, payload_path, VIDEO_MAX_UPLOAD_BYTES, UPLOAD_CHUNK_SIZE):
+            raise HTTPException(status_code=413, detail="Yükleme boyut sınırı aşıldı")
+        await run_in_threadpool(job_queue.submit, kind, payload_path, job_id)
+    except Exception as e:
+        if os.path.exists(payload_path):
+            os.remove(payload_path)
+        if isinstance(e, HTTPException):
+            raise
+        raise HTTPException(status_code=500, detail=str(e))
+    return {"job_id": job_id, "kind": kind, "status": "queued"}
+
+@app.get("/jobs/{job_id}")
+async def read_job(job_id: str, wait: float = Query(0, ge=0, le=JOB_WAIT_MAX_SECONDS)):
+    """Is durumunu dondurur; `wait` verilirse is bitene ya da sure dolana kadar bekler (long-poll)."""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + wait
+    while True:
+        job = await run_in_threadpool(job_queue.get, job_id)
+        if job is None:
+            raise HTTPException(status_code=404, detail="İş bulunamadı")
+        if job["status"] in FINISHED or loop.time() >= deadline:
+            break
+        await asyncio.sleep(JOB_POLL_INTERVAL)
+    job.pop("payload_path")
+    return job
+
+@app.get("/detections/")
+async def read_detections(
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = None,
+    object_name: Optional[str] = None,
+    min_confidence: Optional[float] = Query(None, ge=0, le=1),
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    db: AsyncSession = Depends(get_async_db),
+):
+    try:
+        detections, next_cursor = await get_detections_async(
+            db, limit=limit, cursor=cursor, object_name=object_name,
+            min_confidence=min_confidence, start=start, end=end,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"detections": [detection_to_dict(d) for d in detections], "next_cursor": next_cursor}
+
+@app.get("/detections/export")
+def export_all_detections(
+    format: str = "ndjson",
+    object_name: Optional[str] = None,
+    min_confidence: Optional[float] = Query(None, ge=0, le=1),
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+):
+    try:
+        chunks, media_type = export_detections(
+            format, EXPORT_BATCH_SIZE, object_name=object_name,
+            min_confidence=min_confidence, start=start, end=end,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return StreamingResponse(chunks, media_type=media_type)
+
+@app.get("/metrics")
+async def read_metrics():
+    counts = await run_in_threadpool(job_queue.counts)
+    JOBS_QUEUED.set(counts.get("queued", 0))
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
+
+@app.get("/cache/stats")
+async def cache_stats():
+    return result_cache.stats()
+
+@app.get("/healthz/ready")
+async def readiness():
+    status = {
+        "ready": registry.ready,
+        "backend": registry.backend,
+        "load_seconds": registry.load_seconds,
+        "error": registry.error,
+    }
+    return JSONResponse(status, status_code=200 if registry.ready else 503)
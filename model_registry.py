@@ -0,0 +1,120 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from .inference_backend import load_detector, backend_name
+from .stub_models import StubModel, StubReader
+from ..config import MODEL_PATH, ALLOWED_LANGUAGES, WARMUP_IMAGE_SIZE, USE_STUB_MODELS, STUB_MODEL_DELAY_MS
+
+
+class ModelRegistry:
+    """YOLO ve EasyOCR nesnelerini ilk ihtiyacta yukler ve hazir olma durumunu tutar.
+
+    Ilk yuklenen (birincil) kopya surec genelindedir ve onu ilk isteyen thread sahiplenir;
+    diger thread'ler kendi kopyalarini yukler. Surec havuzu fork ile baslatildiginda
+    cocuk surecler birincil kopyayi ebeveynden devralir ve agirliklar copy-on-write paylasilir.
+    `stub` acikken gercek modeller yerine deterministik StubModel/StubReader kullanilir.
+    """
+
+    def __init__(self, model_path=MODEL_PATH, languages=ALLOWED_LANGUAGES, stub=USE_STUB_MODELS):
+        self.model_path = model_path
+        self.languages = languages
+        self._lock = threading.Lock()
+        self.reset(stub)
+
+    def reset(self, stub=USE_STUB_MODELS):
+        """Yuklu modelleri birakir; testler stub modellere gecmek icin kullanir."""
+        with self._lock:
+            self.stub = stub
+            self.backend = "stub" if stub else backend_name(self.model_path)
+            self.ready = False
+            self.error = None
+            self.load_seconds = None
+            self._local = threading.local()
+            self._primary = {}
+            self._claimed = set()
+
+    def _load(self, name):
+        if self.stub:
+            return StubModel(STUB_MODEL_DELAY_MS) if name == "model" else StubReader()
+        if name == "model":
+            return load_detector(self.model_path)
+        import easyocr
+        return easyocr.Reader(self.languages)
+
+    def _get(self, name):
+        instance = getattr(self._local, name, None)
+        if instance is not None:
+            return instance
+        with self._lock:
+            if name not in self._primary:
+                self._primary[name] = self._load(name)
+            if name not in self._claimed:
+                self._claimed.add(name)
+                instance = self._primary[name]
+        if instance is None:
+            instance = self._load(name)
+        setattr(self._local, name, instance)
+        return instance
+
+    def get_model(self):
+        return self._get("model")
+
+    def get_reader(self):
+        return self._get("reader")
+
+    def preload(self):
+        # Birincil kopyalari yukler ama sahiplenmez; ilk isci thread'i/sureci devralir
+        with self._lock:
+            for name in ("model", "reader"):
+                if name not in self._primary:
+                    self._primary[name] = self._load(name)
+        return self._primary["model"], self._primary["reader"]
+
+    @staticmethod
+    def _warm(model, reader):
+        dummy = np.zeros((WARMUP_IMAGE_SIZE, WARMUP_IMAGE_SIZE, 3), dtype=np.uint8)
+        model(dummy, verbose=False)
+        reader.readtext(dummy[:64, :64])
+
+    def warm_up(self, pools=()):
+        """Modelleri yukleyip isindirir; bitince `ready` True olur.
+
+        `pools` (executor, isci_sayisi) ciftleridir; her isci thread'i/sureci kendi kopyasini
+        hazir olmadan once yukler. Boylece ilk istekler yukleme beklemez ve `load_seconds`
+        tum yuklemeyi icerir. Surec havuzlari `wait_warm` saglamalidir (bkz. WarmProcessPool).
+        """
+        started = time.perf_counter()
+        try:
+            model, reader = self.preload()
+            if not pools:
+                self._warm(model, reader)
+            for executor, workers in pools:
+                if not isinstance(executor, ThreadPoolExecutor):
+                    # Surec havuzunda isitma her surecte bir kez calisan initializer'da yapilir
+                    executor.wait_warm()
+                    continue
+                # Engel her gorevi ayri bir thread'e zorlar
+                barrier = threading.Barrier(workers, timeout=600)
+                for future in [executor.submit(warm_worker, barrier) for _ in range(workers)]:
+                    future.result()
+        except Exception as e:
+            self.error = str(e)
+            raise
+        self.load_seconds = time.perf_counter() - started
+        self.ready = True
+
+
+registry = ModelRegistry()
+
+def get_model():
+    return registry.get_model()
+
+def get_reader():
+    return registry.get_reader()
+
+def warm_worker(barrier=None):
+    # Surec havuzuna gonderilebilmesi icin modul duzeyinde tanimlidir
+    if barrier is not None:
+        barrier.wait()
+    registry._warm(registry.get_model(), registry.get_reader())
@@ -0,0 +1,82 @@
+"""
+Kalici Tesseract motoru.
+
+pytesseract her cagrida yeni bir `tesseract` sureci baslatir ve dil verisini yeniden
+yukler. Bu modul dil verisi bir kez yuklenmis tesserocr.PyTessBaseAPI nesnelerini
+havuzda tutar; etiket basina maliyet yalnizca tanima suresine iner. tesserocr kurulu
+degilse pytesseract'a geri donulur (davranis ayni, yalnizca daha yavas).
+
+Kullanim:
+    motor = get_engine("tur")
+    metinler = motor.recognize([goruntu1, goruntu2])
+"""
+
+import logging
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import cv2
+
+try:
+    import tesserocr
+except ImportError:
+    tesserocr = None
+
+logger = logging.getLogger(__name__)
+
+_engines = {}
+_engines_lock = threading.Lock()
+
+class TesseractEngine:
+    """
+    `pool_size` adet hazir Tesseract ornegi tutar. Ornekler thread'ler arasinda
+    paylasilmaz; her tanima havuzdan bir ornek odunc alir. tesserocr tanima sirasinda
+    GIL'i biraktigi icin `recognize` goruntuleri paralel isler.
+    """
+    def __init__(self, lang="eng", pool_size=2, psm=None):
+        self.lang = lang
+        self.pool_size = pool_size
+        self._apis = queue.Queue()
+        self._executor = ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix=f"tesseract-{lang}")
+        if tesserocr is None:
+            logger.warning("tesserocr bulunamadı, pytesseract kullanılıyor (her çağrı yeni süreç açar).")
+            return
+        for _ in range(pool_size):
+            api = tesserocr.PyTessBaseAPI(lang=lang)
+            if psm is not None:
+                api.SetPageSegMode(psm)
+            self._apis.put(api)
+
+    def recognize_one(self, image):
+        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if image.ndim == 3 else image
+        if tesserocr is None:
+            import pytesseract
+            return pytesseract.image_to_string(gray, lang=self.lang)
+        api = self._apis.get()
+        try:
+            height, width = gray.shape
+            api.SetImageBytes(gray.tobytes(), width, height, 1, width)
+            return api.GetUTF8Text()
+        finally:
+            self._apis.put(api)
+
+    def recognize(self, images):
+        """Goruntu listesini tanir; metinleri ayni sirada dondurur."""
+        images = list(images)
+        if len(images) == 1:
+            return [self.recognize_one(images[0])]
+        return list(self._executor.map(self.recognize_one, images))
+
+    def close(self):
+        self._executor.shutdown()
+        while not self._apis.empty():
+            self._apis.get_nowait().End()
+
+def get_engine(lang="eng", pool_size=2):
+    """Dil ve havuz boyutu basina surec genelinde tek motor dondurur; ilk cagrida olusturulur."""
+    with _engines_lock:
+        engine = _engines.get((lang, pool_size))
+        if engine is None:
+            engine = _engines[(lang, pool_size)] = TesseractEngine(lang, pool_size)
+        return engine
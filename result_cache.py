@@ -0,0 +1,155 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+
+
+def _json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"JSON'a çevrilemeyen değer: {type(value).__name__}")
+
+
+def _json_object(obj):
+    # Diskten okunan zaman damgalari bellek katmaniyla ayni tipte (datetime) doner
+    timestamp = obj.get("timestamp")
+    if isinstance(timestamp, str):
+        obj["timestamp"] = datetime.fromisoformat(timestamp)
+    return obj
+
+
+class ResultCache:
+    """Yuklenen baytlarin ozetine gore tespit sonuclarini saklar.
+
+    Bellek katmani LRU'dur. `disk_dir` verilirse sonuclar ayrica JSON dosyalarina yazilir;
+    disk katmani `disk_ttl_seconds` suresini asan ve `disk_max_bytes` sinirini tasiran
+    en eski kayitlari siler. Anahtara `namespace` (model ve ayar surumu) da katilir.
+    """
+
+    def __init__(self, max_entries=1024, disk_dir=None, disk_ttl_seconds=86400,
+                 disk_max_bytes=256 * 1024 * 1024, namespace=""):
+        self.max_entries = max_entries
+        self.disk_dir = disk_dir
+        self.disk_ttl_seconds = disk_ttl_seconds
+        self.disk_max_bytes = disk_max_bytes
+        self.namespace = namespace.encode()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk_lock = threading.Lock()
+        self._disk_bytes = 0
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+            self._disk_bytes = sum(size for _, _, size in self._disk_entries())
+
+    def key(self, image_bytes):
+        digest = hashlib.blake2b(self.namespace, digest_size=20)
+        digest.update(image_bytes)
+        return digest.hexdigest()
+
+    def get(self, key):
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return self._memory[key]
+        detections = self._read_disk(key)
+        with self._lock:
+            if detections is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.disk_hits += 1
+            self._remember(key, detections)
+        return detections
+
+    def put(self, key, detections):
+        with self._lock:
+            self._remember(key, detections)
+        if self.disk_dir:
+            self._write_disk(key, detections)
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "memory_entries": len(self._memory),
+            "disk_bytes": self._disk_bytes,
+        }
+
+    def _remember(self, key, detections):
+        self._memory[key] = detections
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _path(self, key):
+        return os.path.join(self.disk_dir, f"{key}.json")
+
+    def _read_disk(self, key):
+        if not self.disk_dir:
+            return None
+        path = self._path(key)
+        try:
+            stat = os.stat(path)
+            if time.time() - stat.st_mtime > self.disk_ttl_seconds:
+                if self._remove(path):
+                    with self._lock:
+                        self._disk_bytes -= stat.st_size
+                return None
+            with open(path, encoding="utf-8") as f:
+                return json.load(f, object_hook=_json_object)
+        except (OSError, ValueError):
+            return None
+
+    def _write_disk(self, key, detections):
+        path = self._path(key)
+        data = json.dumps(detections, default=_json_default, ensure_ascii=False).encode("utf-8")
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        with self._disk_lock:
+            # Ayni anahtar yeniden yazilirsa eski dosyanin boyutu toplamdan dusulur
+            try:
+                old_size = os.path.getsize(path)
+            except OSError:
+                old_size = 0
+            os.replace(tmp_path, path)
+        with self._lock:
+            self._disk_bytes += len(data) - old_size
+            over_limit = self._disk_bytes > self.disk_max_bytes
+        if over_limit:
+            self._evict_disk()
+
+    def _disk_entries(self):
+        for entry in os.scandir(self.disk_dir):
+            if entry.name.endswith(".json"):
+                stat = entry.stat()
+                yield entry.path, stat.st_mtime, stat.st_size
+
+    def _evict_disk(self):
+        now = time.time()
+        entries = sorted(self._disk_entries(), key=lambda e: e[1])
+        total = sum(size for _, _, size in entries)
+        for path, mtime, size in entries:
+            if total <= self.disk_max_bytes and now - mtime <= self.disk_ttl_seconds:
+                break
+            self._remove(path)
+            total -= size
+        with self._lock:
+            self._disk_bytes = total
+
+    def _remove(self, path):
+        try:
+            os.remove(path)
+        except OSError:
+            return False
+        return True
@@ -0,0 +1,28 @@
+"""Is kuyrugunu API'den bagimsiz surecler olarak isler.
+
+Kullanim: python run_job_workers.py [--workers 2]
+API'de JOB_WORKERS = 0 yapildiginda isciler bu betikle ayni makinede calistirilir. Kuyruk SQLite
+WAL dosyasidir; ag dosya sistemleri (NFS, SMB) uzerinden paylasilamaz.
+"""
+import argparse
+from src.config import JOB_DB_PATH
+from src.utils.job_queue import start_workers, stop_workers
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--queue", default=JOB_DB_PATH)
+    args = parser.parse_args()
+
+    workers, stop_event = start_workers(args.workers, args.queue)
+    print(f"{args.workers} işçi çalışıyor; durdurmak için Ctrl+C")
+    try:
+        for process in workers:
+            process.join()
+    except KeyboardInterrupt:
+        stop_workers(workers, stop_event)
+
+
+if __name__ == "__main__":
+    main()
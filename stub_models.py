@@ -0,0 +1,62 @@
+import time
+
+
+class StubBox:
+    def __init__(self, xyxy, conf, cls):
+        self.xyxy = [xyxy]
+        self.conf = [conf]
+        self.cls = [cls]
+
+
+class StubResult:
+    def __init__(self, boxes, speed):
+        self.boxes = boxes
+        self.speed = speed
+
+
+class StubModel:
+    """ultralytics.YOLO yerine gecen deterministik ve ucuz model; testler ve yuk testleri icindir.
+
+    Her goruntu icin ortadaki ceyrege bir 'car' kutusu dondurur. `delay_ms` gercek
+    modelin parti basina maliyetini taklit etmek icin uyutur.
+    """
+
+    names = {0: "person", 2: "car", 7: "truck"}
+
+    def __init__(self, delay_ms=0):
+        self.delay_ms = delay_ms
+
+    def __call__(self, source, verbose=True, **kwargs):
+        images = source if isinstance(source, list) else [source]
+        if self.delay_ms:
+            time.sleep(self.delay_ms / 1000)
+        per_image_ms = self.delay_ms / max(1, len(images))
+        results = []
+        for img in images:
+            h, w = img.shape[:2]
+            box = StubBox([w // 4, h // 4, 3 * w // 4, 3 * h // 4], 0.9, 2)
+            results.append(StubResult([box], {"preprocess": 0.0, "inference": per_image_ms, "postprocess": 0.0}))
+        return results
+
+
+class StubReader:
+    """easyocr.Reader yerine gecen deterministik okuyucu; her bolge icin 'STUB' dondurur."""
+
+    def __init__(self, delay_ms=0):
+        self.delay_ms = delay_ms
+
+    def _sleep(self):
+        if self.delay_ms:
+            time.sleep(self.delay_ms / 1000)
+
+    def readtext(self, img, **kwargs):
+        self._sleep()
+        h, w = img.shape[:2]
+        return [([[0, 0], [w // 2, 0], [w // 2, h // 8], [0, h // 8]], "STUB", 0.99)]
+
+    def recognize(self, img_cv_grey, horizontal_list=None, free_list=None, **kwargs):
+        self._sleep()
+        return [
+            ([[x1, y1], [x2, y1], [x2, y2], [x1, y2]], "STUB", 0.99)
+            for x1, x2, y1, y2 in (horizontal_list or [])
+        ]
@@ -1,15 +1,80 @@
-from fastapi.testclient import TestClient
-from src.main import app
-
-client = TestClient(app)
-
-def test_upload_image():
-    with open("tests/test.jpg", "rb") as f:
-        response = client.post("/upload/", files={"file": f})
-    assert response.status_code == 200
-    assert response.json()["status"] == "success"
-
-def test_get_detections():
-    response = client.get("/detections/")
-    assert response.status_code == 200
-    assert isinstance(response.json()["detections"], list)
+import io
+import zipfile
+import pytest
+from fastapi.testclient import TestClient
+import src.main as main
+from src.main import app
+from src.utils import batch_upload
+from src.utils.model_registry import registry
+
+client = TestClient(app)
+
+@pytest.fixture(scope="module", autouse=True)
+def running_app():
+    # Baska test dosyalari registry'yi sifirlamis olabilir; modeller bu modulun testlerinden once isitilir
+    if not registry.ready:
+        registry.warm_up()
+    # Batcher kuyrugu tek olay dongusune bagli; tum istekler ayni dongude calismali
+    with client:
+        yield
+
+def test_upload_image():
+    with open("tests/test.jpg", "rb") as f:
+        response = client.post("/upload/", files={"file": f})
+    assert response.status_code == 200
+    assert response.json()["status"] == "success"
+
+def test_get_detections():
+    response = client.get("/detections/")
+    assert response.status_code == 200
+    assert isinstance(response.json()["detections"], list)
+
+def test_readiness():
+    response = client.get("/healthz/ready")
+    assert response.status_code == 200
+    assert response.json()["ready"] is True
+
+def test_upload_batch_archive():
+    archive = io.BytesIO()
+    with open("tests/test.jpg", "rb") as f:
+        image = f.read()
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.writestr("a.jpg", image)
+        zf.writestr("b.jpg", b"bozuk")
+        zf.writestr("notes.txt", b"yok sayilir")
+    response = client.post("/upload/batch/", files=[
+        ("files", ("flight.zip", archive.getvalue(), "application/zip")),
+        ("files", ("c.jpg", image, "image/jpeg")),
+    ])
+    assert response.status_code == 200
+    body = response.json()
+    assert [r["name"] for r in body["results"]] == ["a.jpg", "b.jpg", "c.jpg"]
+    assert body["failed"] == 1
+
+def test_upload_video_limits(monkeypatch):
+    monkeypatch.setattr(main, "VIDEO_MAX_UPLOAD_BYTES", 10)
+    response = client.post("/upload/video/", files={"file": ("a.mp4", b"0" * 100, "video/mp4")})
+    assert response.status_code == 413
+    assert main.video_pending == 0
+
+    monkeypatch.setattr(main, "VIDEO_MAX_PENDING", 0)
+    response = client.post("/upload/video/", files={"file": ("a.mp4", b"0", "video/mp4")})
+    assert response.status_code == 503
+
+def test_upload_batch_limits_direct_parts(monkeypatch):
+    monkeypatch.setattr(batch_upload, "BATCH_UPLOAD_MAX_MEMBER_BYTES", 10)
+    response = client.post("/upload/batch/", files=[("files", ("big.jpg", b"0" * 100, "image/jpeg"))])
+    assert response.status_code == 200
+    assert response.json()["results"][0]["status"] == "error"
+
+def test_submit_job_size_limit(monkeypatch):
+    monkeypatch.setattr(main, "VIDEO_MAX_UPLOAD_BYTES", 10)
+    response = client.post("/jobs/", files={"file": ("a.mp4", b"0" * 100, "video/mp4")})
+    assert response.status_code == 413
+    lines = client.get("/metrics").text.splitlines()
+    assert any(line.startswith("dronevision_jobs_queued ") for line in lines)
+
+def test_video_slot_is_released_when_processing_ends():
+    response = client.post("/upload/video/", files={"file": ("a.mp4", b"video degil", "video/mp4")})
+    assert response.status_code == 400
+    assert main.video_pending == 0
@@ -0,0 +1,37 @@
+import io
+import tarfile
+import zipfile
+import pytest
+from src.utils.batch_upload import iter_archive, take
+
+def test_iter_archive_reads_zip_and_tar_images_in_order():
+    zip_buffer = io.BytesIO()
+    with zipfile.ZipFile(zip_buffer, "w") as zf:
+        zf.writestr("frames/001.jpg", b"one")
+        zf.writestr("readme.txt", b"skip")
+        zf.writestr("frames/002.PNG", b"two")
+    assert list(iter_archive(zip_buffer)) == [("frames/001.jpg", b"one"), ("frames/002.PNG", b"two")]
+
+    tar_buffer = io.BytesIO()
+    with tarfile.open(fileobj=tar_buffer, mode="w:gz") as tf:
+        for name, data in [("a.jpg", b"aa"), ("b.txt", b"bb"), ("c.jpeg", b"cc")]:
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tf.addfile(info, io.BytesIO(data))
+    members = iter_archive(tar_buffer)
+    assert take(members, 1) == [("a.jpg", b"aa")]
+    assert take(members, 5) == [("c.jpeg", b"cc")]
+
+def test_iter_archive_rejects_unknown_format():
+    with pytest.raises(ValueError):
+        list(iter_archive(io.BytesIO(b"not an archive")))
+
+def test_oversized_members_are_reported_not_read(monkeypatch):
+    import src.utils.batch_upload as batch_upload
+    monkeypatch.setattr(batch_upload, "BATCH_UPLOAD_MAX_MEMBER_BYTES", 4)
+    zip_buffer = io.BytesIO()
+    with zipfile.ZipFile(zip_buffer, "w") as zf:
+        zf.writestr("small.jpg", b"abc")
+        zf.writestr("big.jpg", b"0123456789")
+    (_, small), (_, big) = iter_archive(zip_buffer)
+    assert small == b"abc" and isinstance(big, ValueError)
@@ -0,0 +1,63 @@
+import cv2
+import numpy as np
+from CAMO_BB import ETIKET_ADAY_SAYISI
+from cargo_ocr import (
+    BILINMIYOR, EtiketKareSecici, alanlari_birlestir, etiket_metni_coz, etiket_oku, kare_puani, process_frames,
+)
+
+class SabitMotor:
+    def __init__(self, metinler):
+        self.metinler = iter(metinler)
+        self.partiler = []
+
+    def recognize(self, images):
+        self.partiler.append(len(images))
+        return [next(self.metinler) for _ in images]
+
+def test_etiket_metni_coz_handles_field_order_and_turkish_i():
+    metin = "Soyisim: Yilmaz\nİsim: Ayse\nAdres: Cankaya: Ankara\n"
+    assert etiket_metni_coz(metin) == ("Ayse", "Yilmaz", "Cankaya: Ankara")
+    assert etiket_metni_coz("") == (BILINMIYOR, BILINMIYOR, BILINMIYOR)
+
+def test_alanlari_birlestir_prefers_majority_then_best_frame():
+    cozumler = [("Ali", BILINMIYOR, "X"), ("Veli", "Can", "Y"), ("Ali", "Can", "Y")]
+    assert alanlari_birlestir(cozumler) == ("Ali", "Can", "Y")
+
+def test_process_frames_streams_in_batches_with_pluggable_backend():
+    motor = SabitMotor(f"Isim: K{i}\nSoyisim: S{i}\nAdres: A{i}" for i in range(5))
+    kareler = (np.zeros((10, 10, 3), np.uint8) for _ in range(5))
+    bilgiler = list(process_frames(kareler, motor, parti_boyutu=2, on_isleme=False))
+    assert [b.isim for b in bilgiler] == ["K0", "K1", "K2", "K3", "K4"]
+    assert motor.partiler == [2, 2, 1]
+
+def test_etiket_oku_without_frames_returns_unknown_fields():
+    motor = SabitMotor([])
+    bilgi = etiket_oku([], motor)
+    assert (bilgi.isim, bilgi.soyisim, bilgi.adres, bilgi.metin) == (BILINMIYOR, BILINMIYOR, BILINMIYOR, "")
+    assert motor.partiler == []
+
+def etiketli_kare():
+    kare = np.full((480, 640, 3), 40, np.uint8)
+    cv2.rectangle(kare, (160, 120), (480, 360), (255, 255, 255), -1)
+    for i, satir in enumerate(["Isim: Ayse", "Soyisim: Yilmaz", "Adres: Ankara"]):
+        cv2.putText(kare, satir, (180, 170 + 60 * i), cv2.FONT_HERSHEY_SIMPLEX, 0.9, (0, 0, 0), 2)
+    return kare
+
+def test_kare_puani_prefers_sharp_frames():
+    net = etiketli_kare()
+    bulanik = cv2.GaussianBlur(net, (15, 15), 0)
+    assert kare_puani(bulanik) < kare_puani(net)
+
+def test_etiket_kare_secici_keeps_best_frames_in_order():
+    net = etiketli_kare()
+    kareler = [cv2.GaussianBlur(net, (0, 0), sigma) for sigma in (6, 1, 4, 0.5, 8, 2)]
+    secici = EtiketKareSecici(ETIKET_ADAY_SAYISI)
+    for kare in kareler:
+        secici.degerlendir(kare)
+    beklenen = sorted(kareler, key=kare_puani, reverse=True)[:ETIKET_ADAY_SAYISI]
+    adaylar = secici.adaylar()
+    assert len(adaylar) == ETIKET_ADAY_SAYISI
+    assert all(np.array_equal(aday, kare) for aday, kare in zip(adaylar, beklenen))
+    # Adaylar kopyadir; kamera tamponu yeniden kullanilsa da bozulmaz
+    kareler[3][:] = 0
+    assert adaylar[0].any()
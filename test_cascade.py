@@ -0,0 +1,14 @@
+import cv2
+import numpy as np
+from src.utils.cascade import needs_detector
+
+def test_empty_sky_is_skipped_and_small_object_is_kept():
+    rng = np.random.default_rng(0)
+    sky = np.clip(rng.normal(170, 2, size=(2160, 3840, 3)), 0, 255).astype(np.uint8)
+    assert not needs_detector(sky, mode="edges", threshold=0.01)
+
+    # 4K karede ~60 piksellik kucuk bir nesne tek hucrede yeterli kenar uretir
+    with_object = sky.copy()
+    cv2.rectangle(with_object, (3000, 400), (3060, 440), (40, 40, 40), -1)
+    assert needs_detector(with_object, mode="edges", threshold=0.01)
+    assert needs_detector(sky, mode="off")
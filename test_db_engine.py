@@ -0,0 +1,22 @@
+from sqlalchemy import text
+from src.config import SQLITE_BUSY_TIMEOUT_MS
+from src.utils.db_engine import create_db_engine, get_engine
+
+def pragma(connection, name):
+    return connection.execute(text(f"PRAGMA {name}")).scalar()
+
+def test_shared_engine_connections_use_wal_and_busy_timeout():
+    with get_engine().connect() as connection:
+        assert pragma(connection, "journal_mode") == "wal"
+        assert pragma(connection, "busy_timeout") == SQLITE_BUSY_TIMEOUT_MS
+        assert pragma(connection, "synchronous") == 1  # NORMAL
+
+def test_pragmas_apply_to_every_pooled_connection(tmp_path):
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    first, second = engine.connect(), engine.connect()
+    try:
+        assert [pragma(c, "journal_mode") for c in (first, second)] == ["wal", "wal"]
+    finally:
+        first.close()
+        second.close()
+        engine.dispose()
@@ -0,0 +1,40 @@
+from datetime import datetime
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from src.models.detection import Base, Detection
+from src.utils.db_manager import add_detections_bulk, get_detections
+
+engine = create_engine("sqlite://")
+Base.metadata.create_all(bind=engine)
+TestingSession = sessionmaker(bind=engine)
+
+def test_add_detections_bulk_mixed_rows():
+    db = TestingSession()
+    detections = [
+        {"object_name": "car", "confidence": 0.9, "x1": 0, "y1": 0, "x2": 10, "y2": 10, "timestamp": datetime.now()},
+        {"text": "STOP", "x1": 1, "y1": 1, "x2": 5, "y2": 5, "timestamp": datetime.now()},
+    ]
+    assert add_detections_bulk(db, detections) == 2
+    assert db.query(Detection).count() == 2
+    assert add_detections_bulk(db, []) == 0
+    db.close()
+
+def test_get_detections_paginates_and_filters():
+    db = TestingSession()
+    db.query(Detection).delete()
+    db.commit()
+    add_detections_bulk(db, [
+        {"object_name": "truck" if i % 2 else "car", "confidence": i / 10,
+         "x1": 0, "y1": 0, "x2": 1, "y2": 1, "timestamp": datetime(2024, 1, 1, 0, i)}
+        for i in range(10)
+    ])
+
+    first, cursor = get_detections(db, limit=3, object_name="truck")
+    second, last_cursor = get_detections(db, limit=3, cursor=cursor, object_name="truck")
+    assert [d.confidence for d in first] == [0.9, 0.7, 0.5]
+    assert [d.confidence for d in second] == [0.3, 0.1]
+    assert last_cursor is None
+
+    confident, _ = get_detections(db, min_confidence=0.75)
+    assert [d.confidence for d in confident] == [0.9, 0.8]
+    db.close()
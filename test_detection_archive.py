@@ -0,0 +1,79 @@
+from datetime import datetime
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from src.models.detection import Base, Detection
+from src.utils.db_manager import add_detections_bulk
+from src.utils import detection_archive
+from src.utils.detection_archive import archive_detections, query_archive, count_per_hour
+
+def test_archive_moves_finished_days_and_prunes_partitions(tmp_path):
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    rows = [
+        (datetime(2024, 5, 1, 10, 5), "truck"),
+        (datetime(2024, 5, 1, 10, 40), "truck"),
+        (datetime(2024, 5, 1, 11, 0), "car"),
+        (datetime(2024, 5, 2, 9, 0), "truck"),
+        (datetime(2024, 5, 9, 8, 0), "truck"),
+    ]
+    add_detections_bulk(db, [
+        {"object_name": name, "confidence": 0.9, "x1": 0, "y1": 0, "x2": 1, "y2": 1, "timestamp": ts}
+        for ts, name in rows
+    ])
+
+    archived = archive_detections(db, cutoff=datetime(2024, 5, 3), archive_dir=str(tmp_path))
+    assert archived == 4
+    assert db.query(Detection).count() == 1
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["date=2024-05-01", "date=2024-05-02"]
+
+    table = query_archive(datetime(2024, 5, 2), datetime(2024, 5, 3), archive_dir=str(tmp_path))
+    assert table.num_rows == 1
+    hourly = count_per_hour("truck", datetime(2024, 5, 1), datetime(2024, 5, 3), archive_dir=str(tmp_path))
+    assert [count for _, count in hourly] == [2, 1]
+    db.close()
+
+def _seed(db):
+    add_detections_bulk(db, [
+        {"object_name": "truck", "confidence": 0.9, "x1": 0, "y1": 0, "x2": 1, "y2": 1, "timestamp": ts}
+        for ts in (datetime(2024, 5, 1, 10), datetime(2024, 5, 1, 11), datetime(2024, 5, 2, 9))
+    ])
+
+def test_rerun_after_failed_delete_does_not_duplicate_rows(tmp_path, monkeypatch):
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    _seed(db)
+    def failing_commit():
+        raise RuntimeError("baglanti koptu")
+    monkeypatch.setattr(db, "commit", failing_commit)
+    with pytest.raises(RuntimeError):
+        archive_detections(db, cutoff=datetime(2024, 5, 3), archive_dir=str(tmp_path))
+    monkeypatch.undo()
+    db.rollback()
+
+    assert archive_detections(db, cutoff=datetime(2024, 5, 3), archive_dir=str(tmp_path)) == 3
+    assert db.query(Detection).count() == 0
+    table = query_archive(datetime(2024, 5, 1), datetime(2024, 5, 3), archive_dir=str(tmp_path))
+    assert sorted(table["id"].to_pylist()) == [1, 2, 3]
+    db.close()
+
+def test_failed_archive_leaves_no_temp_files(tmp_path, monkeypatch):
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    _seed(db)
+    table = detection_archive.pa.table
+    calls = []
+    def failing_table(*args, **kwargs):
+        calls.append(1)
+        if len(calls) > 1:
+            raise RuntimeError("disk dolu")
+        return table(*args, **kwargs)
+    monkeypatch.setattr(detection_archive.pa, "table", failing_table)
+    with pytest.raises(RuntimeError):
+        archive_detections(db, cutoff=datetime(2024, 5, 3), archive_dir=str(tmp_path), batch_size=1)
+    assert not [p for p in tmp_path.rglob("*") if p.is_file()]
+    assert db.query(Detection).count() == 3
+    db.close()
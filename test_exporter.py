@@ -0,0 +1,51 @@
+import csv
+import io
+import json
+from datetime import datetime
+import pyarrow as pa
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from src.models.detection import Base
+from src.utils import exporter
+from src.utils.db_manager import add_detections_bulk
+from src.utils.exporter import EXPORT_FIELDS, export_detections
+
+def _use_database(monkeypatch, path, count):
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)
+    db = session()
+    add_detections_bulk(db, [
+        {"object_name": "truck", "confidence": 0.5, "x1": i, "y1": 0, "x2": i + 1, "y2": 1,
+         "timestamp": datetime(2024, 5, 1, 10, i)}
+        for i in range(count)
+    ])
+    db.close()
+    monkeypatch.setattr(exporter, "SessionLocal", session)
+
+def test_export_formats_round_trip_row_counts(tmp_path, monkeypatch):
+    _use_database(monkeypatch, tmp_path / "detections.db", 5)
+
+    chunks, media_type = export_detections("ndjson", batch_size=2)
+    lines = "".join(chunks).splitlines()
+    assert media_type == "application/x-ndjson"
+    assert [json.loads(line)["x1"] for line in lines] == [0, 1, 2, 3, 4]
+
+    chunks, _ = export_detections("csv", batch_size=2)
+    rows = list(csv.reader(io.StringIO("".join(chunks))))
+    assert rows[0] == EXPORT_FIELDS
+    assert len(rows) == 6
+
+    chunks, _ = export_detections("arrow", batch_size=2)
+    table = pa.ipc.open_stream(b"".join(chunks)).read_all()
+    assert table.schema == exporter.arrow_schema()
+    assert table["x1"].to_pylist() == [0, 1, 2, 3, 4]
+
+def test_export_empty_table(tmp_path, monkeypatch):
+    _use_database(monkeypatch, tmp_path / "detections.db", 0)
+
+    assert "".join(export_detections("ndjson", batch_size=2)[0]) == ""
+    rows = list(csv.reader(io.StringIO("".join(export_detections("csv", batch_size=2)[0]))))
+    assert rows == [EXPORT_FIELDS]
+    table = pa.ipc.open_stream(b"".join(export_detections("arrow", batch_size=2)[0])).read_all()
+    assert table.num_rows == 0
@@ -1,9 +1,18 @@
-import pytest
-from src.utils.image_processor import process_image
-
-def test_process_image_with_valid_image():
-    with open("tests/test.jpg", "rb") as f:
-        image_bytes = f.read()
-    detections = process_image(image_bytes)
-    assert isinstance(detections, list)
-    assert len(detections) > 0
+import cv2
+import numpy as np
+import pytest
+from src.utils.image_processor import process_image, process_images_timed
+
+def test_process_image_with_valid_image():
+    with open("tests/test.jpg", "rb") as f:
+        image_bytes = f.read()
+    detections = process_image(image_bytes)
+    assert isinstance(detections, list)
+    assert len(detections) > 0
+
+def test_invalid_items_fail_alone_in_a_batch(stub_registry):
+    valid = cv2.imencode(".jpg", np.full((240, 320, 3), 90, np.uint8))[1].tobytes()
+    results = process_images_timed([valid, b"", valid[:20], memoryview(b"")])
+    detections, timings = results[0]
+    assert isinstance(detections, list) and "decode" in timings
+    assert all(isinstance(r, ValueError) for r in results[1:])
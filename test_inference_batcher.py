@@ -0,0 +1,69 @@
+import asyncio
+from src.utils.inference_batcher import InferenceBatcher, QueueFullError
+
+def test_requests_are_batched():
+    calls = []
+
+    def handler(items):
+        calls.append(list(items))
+        return [item * 2 for item in items]
+
+    async def run():
+        batcher = InferenceBatcher(handler, max_batch_size=4, max_wait_ms=50)
+        results = await asyncio.gather(*(batcher.submit(i) for i in range(4)))
+        await batcher.stop()
+        return results
+
+    assert asyncio.run(run()) == [0, 2, 4, 6]
+    assert calls == [[0, 1, 2, 3]]
+
+def test_item_error_only_fails_its_request():
+    def handler(items):
+        return [ValueError("bozuk") if item < 0 else item for item in items]
+
+    async def run():
+        batcher = InferenceBatcher(handler, max_batch_size=2, max_wait_ms=50)
+        results = await asyncio.gather(batcher.submit(-1), batcher.submit(1), return_exceptions=True)
+        await batcher.stop()
+        return results
+
+    error, ok = asyncio.run(run())
+    assert isinstance(error, ValueError)
+    assert ok == 1
+
+def test_submit_rejects_when_queue_full():
+    async def run():
+        release = asyncio.Event()
+        loop = asyncio.get_running_loop()
+
+        def handler(items):
+            asyncio.run_coroutine_threadsafe(release.wait(), loop).result()
+            return items
+
+        batcher = InferenceBatcher(handler, max_batch_size=1, max_wait_ms=0, max_pending=1)
+        first = asyncio.create_task(batcher.submit(1))
+        await asyncio.sleep(0.01)
+        try:
+            await batcher.submit(2)
+        except QueueFullError:
+            rejected = True
+        else:
+            rejected = False
+        release.set()
+        await first
+        await batcher.stop()
+        return rejected
+
+    assert asyncio.run(run())
+
+def test_stop_fails_requests_already_collected():
+    async def run():
+        batcher = InferenceBatcher(lambda items: items, max_batch_size=4, max_wait_ms=10_000)
+        request = asyncio.create_task(batcher.submit(1))
+        await asyncio.sleep(0.01)
+        await batcher.stop()
+        done, _ = await asyncio.wait([request], timeout=1)
+        return request.exception() if done else None
+
+    error = asyncio.run(run())
+    assert isinstance(error, RuntimeError)
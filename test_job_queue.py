@@ -0,0 +1,45 @@
+import sqlite3
+import time
+from src.utils.job_queue import JobQueue
+
+def test_jobs_are_claimed_once_in_order(tmp_path):
+    queue = JobQueue(str(tmp_path / "jobs.db"))
+    first = queue.submit("image", "a.jpg")
+    second = queue.submit("video", "b.mp4")
+
+    assert queue.claim("w1")["id"] == first
+    assert queue.claim("w2")["id"] == second
+    assert queue.claim("w3") is None
+
+    assert queue.complete(first, "w1", {"detections": [{"object_name": "car"}]})
+    assert queue.fail(second, "w2", "bozuk video")
+    assert queue.get(first)["status"] == "done"
+    assert queue.get(first)["result"] == {"detections": [{"object_name": "car"}]}
+    assert (queue.get(second)["status"], queue.get(second)["error"]) == ("failed", "bozuk video")
+    assert queue.get("yok") is None
+
+def test_long_running_job_with_heartbeat_is_not_requeued(tmp_path):
+    path = str(tmp_path / "jobs.db")
+    queue = JobQueue(path)
+    job_id = queue.submit("video", "long.mp4")
+    queue.claim("w1")
+    # Is uzun suredir calisiyor ama isci kirasini yeniliyor
+    with sqlite3.connect(path) as conn:
+        conn.execute("UPDATE jobs SET started_at = 0, heartbeat_at = 0")
+    assert queue.heartbeat(job_id, "w1")
+    assert queue.requeue_stale(max_seconds=60) == 0
+    assert queue.get(job_id)["worker"] == "w1"
+
+def test_stale_job_is_requeued_and_old_worker_cannot_finish_it(tmp_path):
+    queue = JobQueue(str(tmp_path / "jobs.db"))
+    job_id = queue.submit("image", "a.jpg")
+    queue.claim("w1")
+    assert queue.requeue_stale(max_seconds=60) == 0
+    time.sleep(0.01)
+    assert queue.requeue_stale(max_seconds=0) == 1
+    assert queue.claim("w2")["id"] == job_id
+
+    assert not queue.heartbeat(job_id, "w1")
+    assert not queue.complete(job_id, "w1", {"detections": ["eski"]})
+    assert queue.complete(job_id, "w2", {"detections": []})
+    assert queue.get(job_id)["result"] == {"detections": []}
@@ -0,0 +1,31 @@
+import cv2
+import numpy as np
+from label_roi import etiket_bul, etiket_kirp, koseleri_sirala
+
+def donuk_etiket(aci=20):
+    kare = np.full((600, 800, 3), 30, np.uint8)
+    koseler = cv2.boxPoints(((400, 300), (300, 200), aci))
+    cv2.fillConvexPoly(kare, koseler.astype(np.int32), (255, 255, 255))
+    return kare, koseler
+
+def test_koseleri_sirala_orders_clockwise_from_top_left():
+    karisik = [(100, 80), (10, 90), (90, 5), (0, 0)]
+    sirali = koseleri_sirala(karisik)
+    assert sirali.tolist() == [[0, 0], [90, 5], [100, 80], [10, 90]]
+
+def test_etiket_bul_finds_rotated_label_corners():
+    kare, koseler = donuk_etiket()
+    bulunan = etiket_bul(kare)
+    assert bulunan is not None
+    assert np.abs(bulunan - koseleri_sirala(koseler)).max() < 6
+
+def test_etiket_bul_returns_none_without_label():
+    assert etiket_bul(np.full((600, 800, 3), 30, np.uint8)) is None
+
+def test_etiket_kirp_straightens_label_to_its_size():
+    kare, _ = donuk_etiket()
+    kirpinti = etiket_kirp(kare, etiket_bul(kare))
+    yukseklik, genislik = kirpinti.shape[:2]
+    assert abs(genislik - 300) <= 6 and abs(yukseklik - 200) <= 6
+    # Duzeltilmis kirpinti neredeyse tamamen etiketin beyaz yuzeyidir
+    assert (kirpinti > 200).mean() > 0.95
@@ -0,0 +1,27 @@
+from src.utils.metrics import Histogram, Counter, render, stage_timer, server_timing_header
+
+def test_histogram_and_counter_render():
+    histogram = Histogram("test_stage_seconds", "test", ("stage",), buckets=(0.1, 1.0))
+    histogram.observe(0.05, "decode")
+    histogram.observe(0.5, "decode")
+    counter = Counter("test_frames_total", "test", ("result",))
+    counter.inc("skipped", amount=3)
+
+    text = render()
+    assert 'test_stage_seconds_bucket{stage="decode",le="0.1"} 1' in text
+    assert 'test_stage_seconds_bucket{stage="decode",le="+Inf"} 2' in text
+    assert 'test_stage_seconds_count{stage="decode"} 2' in text
+    assert 'test_frames_total{result="skipped"} 3' in text
+
+def test_stage_timer_accumulates():
+    timings = {}
+    with stage_timer(timings, "ocr"):
+        pass
+    with stage_timer(timings, "ocr"):
+        pass
+    assert list(timings) == ["ocr"]
+    assert server_timing_header({"decode": 0.0012}) == "decode;dur=1.2"
+
+def test_server_timing_reports_tile_count_as_description():
+    header = server_timing_header({"inference": 0.25, "tiles": 7})
+    assert header == 'inference;dur=250.0, tiles;desc="7"'
@@ -0,0 +1,65 @@
+import sys
+import time
+import types
+import numpy as np
+import ocr_engine
+from ocr_engine import TesseractEngine, get_engine
+
+class SahteApi:
+    """tesserocr.PyTessBaseAPI yerine; ayni ornegin iki thread'de kullanilmadigini denetler."""
+    def __init__(self, lang):
+        self.lang = lang
+        self.mesgul = False
+        self.cakisma = False
+        self.goruntu = None
+
+    def SetImageBytes(self, data, width, height, bpp, bpl):
+        if self.mesgul:
+            self.cakisma = True
+        self.mesgul = True
+        self.goruntu = (width, height, data[0])
+
+    def GetUTF8Text(self):
+        time.sleep(0.01)
+        self.mesgul = False
+        return f"{self.goruntu[2]}"
+
+    def End(self):
+        pass
+
+def test_engine_pool_recognizes_in_order_without_sharing_instances(monkeypatch):
+    olusan = []
+    def api(lang):
+        olusan.append(SahteApi(lang))
+        return olusan[-1]
+    monkeypatch.setattr(ocr_engine, "tesserocr", types.SimpleNamespace(PyTessBaseAPI=api))
+    motor = TesseractEngine("tur", pool_size=2)
+    try:
+        goruntuler = [np.full((8, 8), i, np.uint8) for i in range(6)]
+        assert motor.recognize(goruntuler) == [str(i) for i in range(6)]
+        assert motor.recognize(goruntuler[:1]) == ["0"]
+        assert len(olusan) == 2 and not any(api.cakisma for api in olusan)
+    finally:
+        motor.close()
+
+def test_engine_falls_back_to_pytesseract(monkeypatch):
+    monkeypatch.setattr(ocr_engine, "tesserocr", None)
+    cagrilar = []
+    def image_to_string(image, lang):
+        cagrilar.append((image.ndim, lang))
+        return "metin"
+    monkeypatch.setitem(sys.modules, "pytesseract", types.SimpleNamespace(image_to_string=image_to_string))
+    motor = TesseractEngine("tur", pool_size=2)
+    try:
+        assert motor.recognize([np.zeros((8, 8, 3), np.uint8)] * 2) == ["metin", "metin"]
+        # Renkli kareler griye cevrilerek verilir
+        assert cagrilar == [(2, "tur"), (2, "tur")]
+    finally:
+        motor.close()
+
+def test_get_engine_is_cached_per_language_and_pool_size(monkeypatch):
+    monkeypatch.setattr(ocr_engine, "tesserocr", None)
+    monkeypatch.setattr(ocr_engine, "_engines", {})
+    assert get_engine("tur", 2) is get_engine("tur", 2)
+    assert get_engine("tur", 4) is not get_engine("tur", 2)
+    assert get_engine("tur", 4).pool_size == 4
@@ -0,0 +1,31 @@
+import cv2
+import numpy as np
+from src.utils import ocr_gate
+from src.utils.ocr_gate import find_text_lines
+
+def text_image():
+    img = np.full((300, 600, 3), 40, np.uint8)
+    cv2.putText(img, "KARGO 12345", (60, 120), cv2.FONT_HERSHEY_SIMPLEX, 1.5, (255, 255, 255), 3)
+    return img
+
+def test_find_text_lines_boxes_a_text_line():
+    lines = find_text_lines(text_image())
+    assert lines
+    # Kelimeler ayri kutulara dusebilir; hepsi metin satirinin icinde kalir ve birlikte onu kapsar
+    assert all(50 <= x1 and 80 <= y1 and x2 <= 420 and y2 <= 135 for x1, y1, x2, y2 in lines)
+    assert min(x1 for x1, _, _, _ in lines) < 70
+    assert max(x2 for _, _, x2, _ in lines) > 340
+
+def test_find_text_lines_ignores_blank_frames_and_maps_roi():
+    assert find_text_lines(np.full((300, 600, 3), 40, np.uint8)) == []
+    img = text_image()
+    full = sorted(find_text_lines(img))
+    in_roi = sorted(find_text_lines(img, roi=(40, 60, 500, 200)))
+    assert len(in_roi) == len(full)
+    assert all(abs(a - b) <= 2 for box, ref in zip(in_roi, full) for a, b in zip(box, ref))
+
+def test_find_text_lines_scales_boxes_back_to_full_resolution(monkeypatch):
+    monkeypatch.setattr(ocr_gate, "OCR_GATE_MAX_SIDE", 300)
+    lines = find_text_lines(text_image())
+    assert lines
+    assert max(x2 for _, _, x2, _ in lines) > 300
@@ -0,0 +1,59 @@
+import os
+from datetime import datetime
+from src.utils.result_cache import ResultCache
+
+def test_memory_lru_and_counters():
+    cache = ResultCache(max_entries=2)
+    keys = [cache.key(data) for data in (b"a", b"b", b"c")]
+    assert cache.get(keys[0]) is None
+    for i, key in enumerate(keys):
+        cache.put(key, [{"object_name": str(i)}])
+    assert cache.get(keys[0]) is None
+    assert cache.get(keys[2]) == [{"object_name": "2"}]
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+
+def test_namespace_changes_key():
+    assert ResultCache(namespace="v1").key(b"x") != ResultCache(namespace="v2").key(b"x")
+
+def test_disk_tier_survives_restart_and_evicts(tmp_path):
+    cache = ResultCache(max_entries=1, disk_dir=str(tmp_path), disk_max_bytes=10_000)
+    key = cache.key(b"frame")
+    cache.put(key, [{"text": "STOP"}])
+
+    restarted = ResultCache(disk_dir=str(tmp_path))
+    assert restarted.get(key) == [{"text": "STOP"}]
+    assert restarted.stats()["disk_hits"] == 1
+
+    small = ResultCache(disk_dir=str(tmp_path), disk_max_bytes=1)
+    small.put(small.key(b"other"), [{"text": "x" * 100}])
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".json")]
+
+def test_disk_tier_ttl(tmp_path):
+    cache = ResultCache(disk_dir=str(tmp_path), disk_ttl_seconds=-1)
+    key = cache.key(b"frame")
+    cache.put(key, [])
+    assert ResultCache(disk_dir=str(tmp_path), disk_ttl_seconds=-1).get(key) is None
+
+def test_rewriting_a_key_does_not_double_count_disk_bytes(tmp_path):
+    cache = ResultCache(disk_dir=str(tmp_path))
+    key = cache.key(b"frame")
+    cache.put(key, [{"text": "STOP"}])
+    cache.put(key, [{"text": "STOP"}])
+    assert cache.stats()["disk_bytes"] == os.path.getsize(os.path.join(tmp_path, f"{key}.json"))
+
+def test_disk_tier_returns_same_types_as_memory(tmp_path):
+    detections = [{"object_name": "car", "timestamp": datetime(2024, 5, 1, 10, 5)}]
+    cache = ResultCache(disk_dir=str(tmp_path))
+    key = cache.key(b"frame")
+    cache.put(key, detections)
+    assert ResultCache(disk_dir=str(tmp_path)).get(key) == detections
+
+def test_expired_disk_entry_is_subtracted_from_disk_bytes(tmp_path):
+    cache = ResultCache(disk_dir=str(tmp_path), disk_ttl_seconds=-1)
+    key = cache.key(b"frame")
+    cache.put(key, [{"text": "STOP"}])
+    restarted = ResultCache(disk_dir=str(tmp_path), disk_ttl_seconds=-1)
+    assert restarted.get(key) is None
+    assert restarted.stats()["disk_bytes"] == 0
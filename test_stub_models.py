@@ -0,0 +1,54 @@
+import sys
+import types
+from concurrent.futures import ThreadPoolExecutor
+import cv2
+import numpy as np
+from src.utils.image_processor import extract_objects, process_images
+from src.utils.stub_models import StubBox, StubResult
+from src.utils.worker_pool import create_executor
+
+def test_process_images_with_stub_models_is_deterministic(stub_registry):
+    img = np.full((400, 800, 3), 90, np.uint8)
+    cv2.putText(img, "KARGO 123", (50, 100), cv2.FONT_HERSHEY_SIMPLEX, 2, (255, 255, 255), 4)
+    encoded = cv2.imencode(".jpg", img)[1].tobytes()
+
+    first = process_images([encoded, b"bozuk"], persist=False)
+    second = process_images([encoded], persist=False)
+
+    assert isinstance(first[1], ValueError)
+    objects = [d for d in first[0] if "object_name" in d]
+    assert [(d["object_name"], d["x1"], d["y1"], d["x2"], d["y2"]) for d in objects] == [("car", 200, 100, 600, 300)]
+    assert [d["text"] for d in first[0] if "text" in d]
+    strip = lambda detections: [{k: v for k, v in d.items() if k != "timestamp"} for d in detections]
+    assert strip(first[0]) == strip(second[0])
+
+def test_warm_up_loads_every_worker_before_ready(stub_registry, monkeypatch):
+    loads = []
+    load = stub_registry._load
+    monkeypatch.setattr(stub_registry, "_load", lambda name: loads.append(name) or load(name))
+    executor = ThreadPoolExecutor(max_workers=2)
+    try:
+        stub_registry.warm_up([(executor, 2)])
+        assert stub_registry.ready
+        assert sorted(loads) == ["model", "model", "reader", "reader"]
+        # Hazir olduktan sonraki istekler yeni kopya yuklemez
+        list(executor.map(lambda _: stub_registry.get_model(), range(8)))
+        assert len(loads) == 4
+    finally:
+        executor.shutdown()
+
+def test_warm_up_waits_for_every_process_initializer(stub_registry, monkeypatch):
+    # Fork ile baslayan iscilere sahte torch modulu de gecer
+    monkeypatch.setitem(sys.modules, "torch", types.SimpleNamespace(set_num_threads=lambda n: None))
+    executor = create_executor("process", 2)
+    try:
+        stub_registry.warm_up([(executor, 2)])
+        assert stub_registry.ready
+        assert len(executor._processes) == 2
+    finally:
+        executor.shutdown()
+
+def test_extract_objects_uses_given_class_names(stub_registry):
+    result = StubResult([StubBox([1, 2, 3, 4], 0.5, 2)], {})
+    assert extract_objects(result, {2: "kamyonet"})[0]["object_name"] == "kamyonet"
+    assert extract_objects(result)[0]["object_name"] == "car"
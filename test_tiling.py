@@ -0,0 +1,32 @@
+import cv2
+import numpy as np
+from src.utils import image_processor
+from src.utils.image_processor import process_images
+from src.utils.tiling import tile_windows, merge_boxes
+
+def test_tiles_cover_frame_with_overlap():
+    tiles = tile_windows(1500, 700, 640, 0.2)
+    assert tiles[0] == (0, 0, 640, 640)
+    assert tiles[-1] == (860, 60, 1500, 700)
+    assert all(x2 - x1 == 640 and y2 - y1 == 640 for x1, y1, x2, y2 in tiles)
+    assert tile_windows(320, 240, 640, 0.2) == [(0, 0, 320, 240)]
+
+def test_merge_boxes_joins_split_object_per_class():
+    left = {"object_name": "truck", "confidence": 0.6, "x1": 600, "y1": 10, "x2": 640, "y2": 50}
+    full = {"object_name": "truck", "confidence": 0.8, "x1": 590, "y1": 10, "x2": 700, "y2": 50}
+    other = {"object_name": "car", "confidence": 0.7, "x1": 600, "y1": 10, "x2": 640, "y2": 50}
+    merged = merge_boxes([left, full, other], 0.6)
+    assert len(merged) == 2
+    truck = next(d for d in merged if d["object_name"] == "truck")
+    assert (truck["x1"], truck["x2"], truck["confidence"]) == (590, 700, 0.8)
+
+def test_tiled_inference_reports_tile_count_with_total_latency(stub_registry, monkeypatch):
+    monkeypatch.setattr(image_processor, "TILED_INFERENCE", True)
+    monkeypatch.setattr(image_processor, "TILE_SIZE", 400)
+    monkeypatch.setattr(image_processor, "TILE_OVERLAP", 0)
+    img = np.full((400, 800, 3), 90, np.uint8)
+    timings = []
+    process_images([cv2.imencode(".jpg", img)[1].tobytes()], persist=False, timings=timings)
+    # Iki karo ve kucultulmus tam kare tek partide islenir
+    assert timings[0]["tiles"] == 3
+    assert timings[0]["inference"] > 0
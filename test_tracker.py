@@ -0,0 +1,22 @@
+from src.utils.tracker import IouTracker
+
+def box(x, conf=0.5, name="car"):
+    return {"object_name": name, "confidence": conf, "x1": x, "y1": 0, "x2": x + 10, "y2": 10}
+
+def test_moving_object_is_one_track():
+    tracker = IouTracker(iou_threshold=0.3, max_missed=1)
+    for frame, conf in enumerate([0.5, 0.9, 0.6]):
+        assert tracker.update([box(frame * 2, conf)], frame) == []
+    tracks = tracker.flush()
+    assert len(tracks) == 1
+    assert tracks[0].best["confidence"] == 0.9
+    assert tracks[0].hits == 3
+
+def test_classes_do_not_merge_and_lost_tracks_finish():
+    tracker = IouTracker(max_missed=1)
+    tracker.update([box(0, name="car"), box(0, name="truck")], 0)
+    assert len(tracker.active) == 2
+    assert tracker.update([], 1) == []
+    finished = tracker.update([], 2)
+    assert sorted(t.best["object_name"] for t in finished) == ["car", "truck"]
+    assert tracker.active == []
@@ -0,0 +1,62 @@
+import asyncio
+import io
+from types import SimpleNamespace
+import cv2
+import numpy as np
+from src.utils.upload_reader import BufferPool, read_upload
+from src.utils.image_processor import jpeg_size, decode_flag, decode_image, scale_detections
+
+def encode(img, *params):
+    return cv2.imencode(".jpg", img, list(params))[1].tobytes()
+
+def test_jpeg_size_reads_baseline_and_progressive_headers():
+    img = np.zeros((1500, 4000, 3), np.uint8)
+    assert jpeg_size(encode(img)) == (4000, 1500)
+    assert jpeg_size(encode(img, cv2.IMWRITE_JPEG_PROGRESSIVE, 1)) == (4000, 1500)
+
+def test_non_jpeg_input_is_decoded_at_full_size():
+    png = cv2.imencode(".png", np.zeros((3000, 4000, 3), np.uint8))[1].tobytes()
+    assert jpeg_size(png) is None
+    assert jpeg_size(b"\xff\xd8") is None
+    assert decode_flag(png) == (cv2.IMREAD_COLOR, 1)
+    img, scale = decode_image(png)
+    assert img.shape[:2] == (3000, 4000) and scale == 1
+
+def test_reduced_decode_boxes_map_back_to_original_pixels():
+    original = np.zeros((3000, 5200, 3), np.uint8)
+    cv2.rectangle(original, (1200, 800), (2000, 1600), (255, 255, 255), -1)
+    img, scale = decode_image(encode(original, cv2.IMWRITE_JPEG_QUALITY, 95))
+    assert scale == 4 and img.shape[:2] == (750, 1300)
+
+    ys, xs = np.nonzero(cv2.cvtColor(img, cv2.COLOR_BGR2GRAY) > 128)
+    box = {"x1": int(xs.min()), "y1": int(ys.min()), "x2": int(xs.max()) + 1, "y2": int(ys.max()) + 1}
+    scale_detections([box], scale)
+    assert all(abs(box[k] - v) <= scale for k, v in {"x1": 1200, "y1": 800, "x2": 2001, "y2": 1601}.items())
+
+def test_buffer_pool_reuses_released_buffers():
+    pool = BufferPool(max_buffers=1, initial_size=16)
+    buffer = pool.acquire(8)
+    assert len(buffer) == 16
+    pool.release(buffer)
+    pool.release(bytearray(16))
+    assert pool.acquire(10) is buffer
+    assert pool.acquire(32) is not buffer
+
+def test_buffer_pool_drops_oversized_buffers():
+    pool = BufferPool(initial_size=16)
+    big = pool.acquire(64)
+    pool.release(big)
+    assert pool.acquire(64) is not big
+
+def test_read_upload_without_readinto():
+    class ReadOnlyFile:
+        def __init__(self, data):
+            self._file = io.BytesIO(data)
+            self.seek = self._file.seek
+            self.read = self._file.read
+
+    data = bytes(range(256)) * 100
+    pool = BufferPool(initial_size=16)
+    upload = SimpleNamespace(size=None, file=ReadOnlyFile(data))
+    buffer, view = asyncio.run(read_upload(upload, pool))
+    assert bytes(view) == data
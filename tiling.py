@@ -0,0 +1,48 @@
+def _starts(length, tile_size, step):
+    if length <= tile_size:
+        return [0]
+    starts = list(range(0, length - tile_size, step))
+    starts.append(length - tile_size)
+    return starts
+
+
+def tile_windows(width, height, tile_size, overlap):
+    """Goruntuyu ortusen karolara boler; (x1, y1, x2, y2) listesi dondurur. Son karolar kenara hizalanir."""
+    step = max(1, int(tile_size * (1 - overlap)))
+    return [
+        (x, y, min(x + tile_size, width), min(y + tile_size, height))
+        for y in _starts(height, tile_size, step)
+        for x in _starts(width, tile_size, step)
+    ]
+
+
+def intersection_over_smaller(a, b):
+    ix1, iy1 = max(a["x1"], b["x1"]), max(a["y1"], b["y1"])
+    ix2, iy2 = min(a["x2"], b["x2"]), min(a["y2"], b["y2"])
+    inter = max(0, ix2 - ix1) * max(0, iy2 - iy1)
+    if inter == 0:
+        return 0.0
+    area_a = (a["x2"] - a["x1"]) * (a["y2"] - a["y1"])
+    area_b = (b["x2"] - b["x1"]) * (b["y2"] - b["y1"])
+    return inter / float(min(area_a, area_b))
+
+
+def merge_boxes(detections, threshold):
+    """Karo sinirlarinda bolunen ve ortusen kutulari sinif bazinda birlestirir (greedy NMM).
+
+    IoU yerine kucuk kutuya gore kesisim kullanilir; boylece bir karoda yarim kalan nesne
+    komsu karodaki tam kutuyla eslesir. Birlesen kutu tum eslesenleri kapsar, guven en yuksek olandir.
+    """
+    merged = []
+    for detection in sorted(detections, key=lambda d: d["confidence"], reverse=True):
+        for kept in merged:
+            if kept["object_name"] == detection["object_name"] and \
+                    intersection_over_smaller(kept, detection) >= threshold:
+                kept["x1"] = min(kept["x1"], detection["x1"])
+                kept["y1"] = min(kept["y1"], detection["y1"])
+                kept["x2"] = max(kept["x2"], detection["x2"])
+                kept["y2"] = max(kept["y2"], detection["y2"])
+                break
+        else:
+            merged.append(dict(detection))
+    return merged
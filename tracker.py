@@ -0,0 +1,71 @@
+def iou(a, b):
+    ix1, iy1 = max(a["x1"], b["x1"]), max(a["y1"], b["y1"])
+    ix2, iy2 = min(a["x2"], b["x2"]), min(a["y2"], b["y2"])
+    inter = max(0, ix2 - ix1) * max(0, iy2 - iy1)
+    if inter == 0:
+        return 0.0
+    area_a = (a["x2"] - a["x1"]) * (a["y2"] - a["y1"])
+    area_b = (b["x2"] - b["x1"]) * (b["y2"] - b["y1"])
+    return inter / float(area_a + area_b - inter)
+
+
+class Track:
+    def __init__(self, track_id, detection, frame_index):
+        self.track_id = track_id
+        self.last = detection
+        self.best = detection
+        self.first_frame = frame_index
+        self.last_frame = frame_index
+        self.hits = 1
+        self.missed = 0
+
+    def update(self, detection, frame_index):
+        self.last = detection
+        self.last_frame = frame_index
+        self.hits += 1
+        self.missed = 0
+        if detection["confidence"] > self.best["confidence"]:
+            self.best = detection
+
+
+class IouTracker:
+    """Ardisik karelerdeki ayni sinif kutularini IoU ile eslestiren hafif takipci.
+
+    `max_missed` kare boyunca eslesmeyen izler kapatilir ve `update` tarafindan dondurulur.
+    """
+
+    def __init__(self, iou_threshold=0.3, max_missed=5):
+        self.iou_threshold = iou_threshold
+        self.max_missed = max_missed
+        self.active = []
+        self._next_id = 1
+
+    def update(self, detections, frame_index):
+        # Guvenceye gore sirali acgozlu eslestirme; kare basina birkac kutu icin yeterli
+        unmatched = list(self.active)
+        for detection in sorted(detections, key=lambda d: d["confidence"], reverse=True):
+            best_track, best_iou = None, self.iou_threshold
+            for track in unmatched:
+                if track.last["object_name"] != detection["object_name"]:
+                    continue
+                overlap = iou(track.last, detection)
+                if overlap >= best_iou:
+                    best_track, best_iou = track, overlap
+            if best_track is None:
+                self.active.append(Track(self._next_id, detection, frame_index))
+                self._next_id += 1
+            else:
+                best_track.update(detection, frame_index)
+                unmatched.remove(best_track)
+
+        finished = []
+        for track in unmatched:
+            track.missed += 1
+            if track.missed > self.max_missed:
+                finished.append(track)
+        self.active = [t for t in self.active if t not in finished]
+        return finished
+
+    def flush(self):
+        finished, self.active = self.active, []
+        return finished
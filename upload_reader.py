@@ -0,0 +1,94 @@
+import os
+import threading
+from fastapi.concurrency import run_in_threadpool
+
+
+class BufferPool:
+    """Yukleme tamponlarini istekler arasinda yeniden kullanir; her istekte yeni bellek ayrilmaz.
+
+    `max_buffer_size` (verilmezse `initial_size`) ustundeki tamponlar havuza geri alinmaz;
+    boylece havuz en fazla `max_buffers * max_buffer_size` bellek tutar.
+    """
+
+    def __init__(self, max_buffers=8, initial_size=4 * 1024 * 1024, max_buffer_size=None):
+        self.max_buffers = max_buffers
+        self.initial_size = initial_size
+        self.max_buffer_size = max_buffer_size or initial_size
+        self._free = []
+        self._lock = threading.Lock()
+
+    def acquire(self, size):
+        with self._lock:
+            for i, buffer in enumerate(self._free):
+                if len(buffer) >= size:
+                    return self._free.pop(i)
+        return bytearray(max(size, self.initial_size))
+
+    def release(self, buffer):
+        if len(buffer) > self.max_buffer_size:
+            return
+        with self._lock:
+            if len(self._free) < self.max_buffers:
+                self._free.append(buffer)
+
+
+def _file_size(fileobj):
+    size = fileobj.seek(0, os.SEEK_END)
+    fileobj.seek(0)
+    return size
+
+
+def _readinto(fileobj, buffer, size, chunk_size=1024 * 1024):
+    fileobj.seek(0)
+    view = memoryview(buffer)
+    # SpooledTemporaryFile.readinto yalnizca Python 3.11+ ile gelir; yoksa parca parca kopyalanir
+    readinto = getattr(fileobj, "readinto", None)
+    read = 0
+    while read < size:
+        if readinto is not None:
+            n = readinto(view[read:size])
+        else:
+            chunk = fileobj.read(min(chunk_size, size - read))
+            n = len(chunk)
+            view[read:read + n] = chunk
+        if not n:
+            break
+        read += n
+    return view[:read]
+
+
+def _copy_limited(fileobj, path, limit, chunk_size=1024 * 1024):
+    fileobj.seek(0)
+    written = 0
+    with open(path, "wb") as f:
+        while chunk := fileobj.read(chunk_size):
+            written += len(chunk)
+            if written > limit:
+                return False
+            f.write(chunk)
+    return True
+
+
+async def save_upload(file, path, limit, chunk_size=1024 * 1024):
+    """UploadFile icerigini olay dongusunu bloklamadan dosyaya yazar; `limit` asilirsa False doner."""
+    if file.size is not None and file.size > limit:
+        return False
+    return await run_in_threadpool(_copy_limited, file.file, path, limit, chunk_size)
+
+
+async def read_upload(file, pool):
+    """UploadFile icerigini havuzdan alinan tampona ara `bytes` kopyasi olusturmadan okur.
+
+    (tampon, memoryview) dondurur; cagiran isi bitince tamponu `pool.release` ile geri vermelidir.
+    """
+    size = file.size
+    if size is None:
+        size = await run_in_threadpool(_file_size, file.file)
+    buffer = pool.acquire(size)
+    try:
+        view = await run_in_threadpool(_readinto, file.file, buffer, size)
+    except Exception:
+        # Iptalde (CancelledError) thread hala tampona yaziyor olabilir; havuza geri verilmez
+        pool.release(buffer)
+        raise
+    return buffer, view
@@ -0,0 +1,94 @@
+import cv2
+import numpy as np
+from datetime import datetime, timedelta
+from .model_registry import get_model
+from .image_processor import extract_objects, save_detections
+from .tracker import IouTracker
+from .cascade import needs_detector
+from ..config import (
+    BATCH_MAX_SIZE, VIDEO_FRAME_STRIDE, VIDEO_DIFF_THRESHOLD, VIDEO_MAX_SKIP,
+    TRACK_IOU_THRESHOLD, TRACK_MAX_MISSED,
+)
+
+
+def frame_signature(frame):
+    small = cv2.resize(frame, (32, 32), interpolation=cv2.INTER_AREA)
+    return cv2.cvtColor(small, cv2.COLOR_BGR2GRAY).astype(np.int16)
+
+
+def sample_frames(cap, stats):
+    """Videoyu sirayla cozer; neredeyse ayni kareleri ucuz bir kucuk resim farkiyla atlar.
+
+    `VIDEO_MAX_SKIP` kareden uzun sure atlama yapilmaz ki takipci izleri kaybetmesin.
+    """
+    last_signature = None
+    skipped = 0
+    index = -1
+    while True:
+        # grab() kareyi cozmeden ilerler; yalnizca adim araligindaki kareler cozulur
+        if not cap.grab():
+            break
+        index += 1
+        stats["frames_total"] += 1
+        if index % VIDEO_FRAME_STRIDE:
+            continue
+        ok, frame = cap.retrieve()
+        if not ok:
+            break
+        signature = frame_signature(frame)
+        if last_signature is not None and skipped < VIDEO_MAX_SKIP:
+            if np.abs(signature - last_signature).mean() < VIDEO_DIFF_THRESHOLD:
+                skipped += 1
+                stats["frames_skipped"] += 1
+                continue
+        last_signature = signature
+        skipped = 0
+        yield index, frame
+
+
+def track_to_detection(track, started_at, fps):
+    detection = dict(track.best)
+    detection["timestamp"] = started_at + timedelta(seconds=track.first_frame / fps)
+    return detection
+
+
+def process_video(video_path, persist=True):
+    cap = cv2.VideoCapture(video_path)
+    if not cap.isOpened():
+        raise ValueError("Video açılamadı")
+    fps = cap.get(cv2.CAP_PROP_FPS) or 25.0
+    started_at = datetime.now()
+    tracker = IouTracker(TRACK_IOU_THRESHOLD, TRACK_MAX_MISSED)
+    stats = {"frames_total": 0, "frames_skipped": 0, "frames_gated": 0, "frames_processed": 0}
+    finished = []
+
+    def run_batch(batch):
+        # Kaskadin bos saydigi kareler izleri yaslandirmak icin takipciye bos gecer
+        keep = [needs_detector(frame) for _, frame in batch]
+        frames = [frame for (_, frame), k in zip(batch, keep) if k]
+        results = iter(get_model()(frames, verbose=False) if frames else [])
+        for (index, _), k in zip(batch, keep):
+            objects = extract_objects(next(results)) if k else []
+            finished.extend(tracker.update(objects, index))
+        stats["frames_gated"] += len(batch) - len(frames)
+        stats["frames_processed"] += len(frames)
+
+    try:
+        batch = []
+        for index, frame in sample_frames(cap, stats):
+            batch.append((index, frame))
+            if len(batch) >= BATCH_MAX_SIZE:
+                run_batch(batch)
+                batch = []
+        if batch:
+            run_batch(batch)
+    finally:
+        cap.release()
+
+    finished.extend(tracker.flush())
+    # Her iz icin yalnizca en yuksek guvenli kutu saklanir
+    detections = [track_to_detection(track, started_at, fps) for track in finished]
+    if persist:
+        save_detections(detections)
+    stats["tracks"] = len(detections)
+    return {"stats": stats, "detections": detections}
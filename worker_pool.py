@@ -0,0 +1,53 @@
+import os
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+
+def _init_process_worker(threads_per_worker, warmed):
+    # torch'un tum cekirdekleri kapmasi diger iscileri yavaslatir
+    import torch
+    torch.set_num_threads(threads_per_worker)
+    # Initializer her surecte tam bir kez calisir; modeller ilk istekten once isitilir
+    from .model_registry import warm_worker
+    warm_worker()
+    warmed.release()
+
+
+class WarmProcessPool(ProcessPoolExecutor):
+    """Her isci sureci baslarken modelleri isitan surec havuzu; `wait_warm` hepsini bekler."""
+
+    def __init__(self, workers, threads_per_worker, mp_context=None):
+        context = mp_context or multiprocessing.get_context()
+        self.workers = workers
+        self._warmed = context.Semaphore(0)
+        super().__init__(
+            max_workers=workers,
+            mp_context=context,
+            initializer=_init_process_worker,
+            initargs=(threads_per_worker, self._warmed),
+        )
+
+    def wait_warm(self):
+        # Gonderimler surecleri baslatir (fork'ta hepsi birden, digerlerinde gonderim basina bir surec);
+        # hazir sayilmak icin her surecin initializer'i bitmis olmalidir
+        futures = [self.submit(int) for _ in range(self.workers)]
+        for _ in range(self.workers):
+            while not self._warmed.acquire(timeout=1):
+                for future in futures:
+                    if future.done() and future.exception() is not None:
+                        raise future.exception()
+
+
+def create_executor(kind="thread", workers=2):
+    if workers < 1:
+        raise ValueError("workers en az 1 olmali")
+    if kind == "thread":
+        return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="inference")
+    if kind == "process":
+        threads_per_worker = max(1, (os.cpu_count() or 1) // workers)
+        # fork ile cocuk surecler ebeveynde onceden yuklenmis model agirliklarini paylasir
+        context = None
+        if "fork" in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context("fork")
+        return WarmProcessPool(workers, threads_per_worker, mp_context=context)
+    raise ValueError(f"Bilinmeyen executor turu: {kind}")